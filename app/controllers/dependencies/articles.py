@@ -1,4 +1,5 @@
 from typing import Optional
+from asyncpg import Record
 from fastapi import Query, Depends, HTTPException, Path
 from starlette import status
 
@@ -10,19 +11,37 @@ from app.repositories.data.articles import ArticlesRepository
 from app.models.domain.articles import Article
 from app.models.domain.users import User
 from app.toolkit import constants
+from app.toolkit.cursor import Keyset, decode_cursor
 
 from app.models.schemas.articles import (
     DEFAULT_ARTICLES_LIMIT,
     DEFAULT_ARTICLES_OFFSET,
+    ArticlesCountMode,
     ArticlesFilters,
 )
 
+def get_articles_cursor(
+    after: Optional[str] = Query(None, min_length=1),
+) -> Optional[Keyset]:
+    if not after:
+        return None
+
+    try:
+        return decode_cursor(after)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=constants.MALFORMED_CURSOR,
+        )
+
 def get_articles_filters(
     tag: Optional[str] = None,
     author: Optional[str] = None,
     favorited: Optional[str] = None,
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+    after: Optional[Keyset] = Depends(get_articles_cursor),
+    count: ArticlesCountMode = ArticlesCountMode.exact,
 ) -> ArticlesFilters:
     return ArticlesFilters(
         tag=tag,
@@ -30,6 +49,8 @@ def get_articles_filters(
         favorited=favorited,
         limit=limit,
         offset=offset,
+        after=after,
+        count=count,
     )
 
 async def get_article_by_slug_from_path(
@@ -54,3 +75,27 @@ def check_article_modification_permissions(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=constants.USER_IS_NOT_AUTHOR_OF_ARTICLE,
         )
+
+async def get_article_validators_from_path(
+    slug: str = Path(..., min_length=1),
+    current_user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    articles_repo: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+) -> Record:
+    try:
+        return await articles_repo.get_article_validators_by_slug(slug=slug, requested_user=current_user)
+    except EntityDoesNotExist:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=constants.ARTICLE_DOES_NOT_EXIST_ERROR,
+        )
+
+def check_article_read_permissions(
+    article_validators: Record = Depends(get_article_validators_from_path),
+    current_user: User = Depends(get_current_user_authorizer()),
+) -> None:
+    # same rule as check_article_modification_permissions, without hydrating the article
+    if article_validators["author_username"] != current_user.username:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=constants.USER_IS_NOT_AUTHOR_OF_ARTICLE,
+        )
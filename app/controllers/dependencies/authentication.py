@@ -9,9 +9,10 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.controllers.dependencies.database import get_repository
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
+from app.repositories.cache import get_principals_cache
 from app.repositories.errors import EntityDoesNotExist
 from app.repositories.data.authentication import AuthenticationRepository
-from app.models.domain.users import User
+from app.models.domain.authentication import Principal
 from app.toolkit import constants
 from app.toolkit import jwt
 
@@ -73,9 +74,9 @@ async def _get_current_user(
     authentication_repository: AuthenticationRepository = Depends(get_repository(AuthenticationRepository)),
     token: str = Depends(_get_authorization_header_retriever()),
     settings: AppSettings = Depends(get_app_settings),
-) -> User:
+) -> Principal:
     try:
-        username = jwt.get_username_from_token(
+        token_user = jwt.get_user_from_token(
             token,
             str(settings.secret_key.get_secret_value()),
         )
@@ -85,19 +86,34 @@ async def _get_current_user(
             detail=constants.MALFORMED_PAYLOAD,
         )
 
+    principals_cache = get_principals_cache()
+    principal = principals_cache.get(token_user.username)
+    if principal:
+        return principal
+
+    # trusting the claims means a deleted user keeps access until the token expires
+    if settings.principal_trust_token_claims and token_user.id is not None:
+        return Principal(id=token_user.id, username=token_user.username)
+
+    cache_version = principals_cache.version
     try:
-        return await authentication_repository.get_user_by_username(username=username)
+        principal = await authentication_repository.get_principal_by_username(username=token_user.username)
     except EntityDoesNotExist:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=constants.MALFORMED_PAYLOAD,
         )
 
+    # invalidations come from the primary, a lagging replica could cache a user deleted there
+    if not authentication_repository.last_read_from_replica:
+        principals_cache.set(token_user.username, principal, version=cache_version)
+    return principal
+
 async def _get_current_user_optional(
     authentication_repository: AuthenticationRepository = Depends(get_repository(AuthenticationRepository)),
     token: str = Depends(_get_authorization_header_retriever(required=False)),
     settings: AppSettings = Depends(get_app_settings),
-) -> Optional[User]:
+) -> Optional[Principal]:
     if token:
         return await _get_current_user(authentication_repository, token, settings)
 
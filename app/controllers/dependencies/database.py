@@ -1,26 +1,29 @@
-from typing import AsyncGenerator, Callable, Type
+from typing import Callable, Optional, Type
 
-from asyncpg.connection import Connection
-from asyncpg.pool import Pool
 from fastapi import Depends
 from starlette.requests import Request
 
 from app.repositories.data.base import BaseRepository
+from app.repositories.pool import InstrumentedPool, LazyConnection, Replica
 
-def _get_db_pool(request: Request) -> Pool:
+def _get_db_pool(request: Request) -> InstrumentedPool:
     return request.app.state.pool
 
+def _get_db_replica(request: Request) -> Optional[Replica]:
+    return request.app.state.replica
+
 async def _get_connection_from_pool(
-    pool: Pool = Depends(_get_db_pool),
-) -> AsyncGenerator[Connection, None]:
-    async with pool.acquire() as conn:
-        yield conn
+    pool: InstrumentedPool = Depends(_get_db_pool),
+    replica: Optional[Replica] = Depends(_get_db_replica),
+) -> LazyConnection:
+    # checked out per statement or unit of work, never for the whole request
+    return LazyConnection(pool, replica)
 
 def get_repository(
     repo_type: Type[BaseRepository],
-) -> Callable[[Connection], BaseRepository]:
+) -> Callable[[LazyConnection], BaseRepository]:
     def _get_repo(
-        conn: Connection = Depends(_get_connection_from_pool),
+        conn: LazyConnection = Depends(_get_connection_from_pool),
     ) -> BaseRepository:
         return repo_type(conn)
 
@@ -1,32 +1,71 @@
+from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import ValidationError
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
 
+from app.controllers.dependencies.articles import get_articles_cursor
 from app.controllers.dependencies.authentication import get_current_user_authorizer
 from app.controllers.dependencies.database import get_repository
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
 from app.models.schemas.articles import (
     DEFAULT_ARTICLES_LIMIT,
     DEFAULT_ARTICLES_OFFSET,
     ArticleForResponse,
+    ArticleImportFailure,
+    ArticleSearchResultForResponse,
+    ArticlesCountMode,
+    ArticlesExportFormat,
+    RequestImportArticle,
+    ResponseImportArticles,
     ResponseListArticles,
+    ResponseSearchArticles,
+)
+from app.repositories.data.articles import (
+    ArticlesRepository,
+    get_next_cursor_for_articles,
+    get_slug_for_article,
 )
-from app.repositories.data.articles import ArticlesRepository
 from app.models.domain.users import User
-from app.toolkit import response, constants
+from app.toolkit import response, conditional, constants, export, ndjson
+from app.toolkit.cursor import Keyset
 
 router = APIRouter()
 
+IMPORT_FAILURE_REASONS = {
+    "author_does_not_exist": constants.USER_DOES_NOT_EXIST_ERROR,
+    "duplicated_in_import": constants.ARTICLE_DUPLICATED_IN_IMPORT,
+    "article_already_exists": constants.ARTICLE_ALREADY_EXISTS,
+}
+
+EXPORT_MEDIA_TYPES = {
+    ArticlesExportFormat.ndjson: "application/x-ndjson",
+    ArticlesExportFormat.csv: "text/csv",
+}
+
 @router.get("/feed", name="Get Articles for Feed", response_model=ResponseListArticles)
 async def get_articles_for_feed(
+    request: Request,
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+    after: Optional[Keyset] = Depends(get_articles_cursor),
+    count: ArticlesCountMode = ArticlesCountMode.exact,
     current_user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
-    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository))
+    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ResponseListArticles:
 
-    articles = await articles_repository.get_articles_for_feed(
+    # a signed in user reads their own timeline, which is always counted exactly
+    estimate_count = count == ArticlesCountMode.estimate and current_user is None
+
+    articles, articles_count = await articles_repository.get_articles_for_feed(
         limit=limit, 
         offset=offset,
+        after=after,
+        estimate_count=estimate_count,
         requested_user=current_user,
     )
 
@@ -37,14 +76,141 @@ async def get_articles_for_feed(
         )
 
     articles_for_response = [
-        ArticleForResponse(**article.dict()) for article in articles
+        ArticleForResponse.from_validated(article) for article in articles
     ]
 
-    return await response.response_success(
+    articles_response = await response.response_success(
         status_code=status.HTTP_200_OK,
         message="Success",
         data=ResponseListArticles(
+            articles=articles_for_response,
+            articles_count=articles_count,
+            # keyset pages come without a total, it was reported with the first page
+            articles_count_mode=None if after else (
+                ArticlesCountMode.estimate if estimate_count else ArticlesCountMode.exact
+            ),
+            next_cursor=get_next_cursor_for_articles(articles, limit),
+        )
+    )
+
+    # only the anonymous global feed is the same for everyone and safe to share
+    return conditional.conditional_response(
+        request,
+        articles_response,
+        cache_control=conditional.public_cache_control(
+            settings.http_cache_max_age,
+        ) if current_user is None else conditional.PRIVATE_CACHE_CONTROL,
+    )
+
+@router.get("/search", name="Search Articles", response_model=ResponseSearchArticles)
+async def search_articles(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
+    offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+    current_user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository))
+) -> ResponseSearchArticles:
+
+    articles = await articles_repository.search_articles(
+        query=q,
+        limit=limit,
+        offset=offset,
+        requested_user=current_user,
+    )
+
+    if not articles:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=constants.ARTICLE_DOES_NOT_EXIST_ERROR,
+        )
+
+    articles_for_response = [
+        ArticleSearchResultForResponse.from_validated(article) for article in articles
+    ]
+
+    return await response.response_success(
+        status_code=status.HTTP_200_OK,
+        message="Success",
+        data=ResponseSearchArticles(
             articles=articles_for_response,
             articles_count=len(articles),
         )
-    )
\ No newline at end of file
+    )
+
+@router.post("/import", name="Import Articles", response_model=ResponseImportArticles)
+async def import_articles(
+    request: Request,
+    current_user: User = Depends(get_current_user_authorizer()),
+    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository))
+) -> ResponseImportArticles:
+    records = []
+    failures = []
+
+    async for line_number, line in ndjson.iter_lines(request.stream()):
+        try:
+            article = RequestImportArticle.parse_raw(line)
+        except ValidationError:
+            failures.append(
+                ArticleImportFailure(line=line_number, error=constants.MALFORMED_IMPORT_LINE),
+            )
+            continue
+
+        slug = article.slug or get_slug_for_article(article.title)
+        # callers only import their own articles, an author naming anyone else is refused
+        if article.author is not None and article.author != current_user.username:
+            failures.append(
+                ArticleImportFailure(line=line_number, slug=slug, error=constants.USER_IS_NOT_AUTHOR_OF_ARTICLE),
+            )
+            continue
+
+        records.append((
+            line_number,
+            slug,
+            article.title,
+            article.description,
+            article.body,
+            article.image,
+            current_user.username,
+            article.tags,
+            article.created_at,
+        ))
+
+    failed_rows = await articles_repository.import_articles(records=records) if records else []
+    failures.extend(
+        ArticleImportFailure(
+            line=failed_row["line_number"],
+            slug=failed_row["slug"],
+            error=IMPORT_FAILURE_REASONS[failed_row["reason"]],
+        )
+        for failed_row in failed_rows
+    )
+
+    return await response.response_success(
+        status_code=status.HTTP_200_OK,
+        message="Articles Imported",
+        data=ResponseImportArticles(
+            imported_count=len(records) - len(failed_rows),
+            failures=sorted(failures, key=lambda failure: failure.line),
+        )
+    )
+
+@router.get("/export", name="Export Articles")
+async def export_articles(
+    format: ArticlesExportFormat = ArticlesExportFormat.ndjson,
+    updated_since: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user_authorizer()),
+    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    settings: AppSettings = Depends(get_app_settings),
+) -> StreamingResponse:
+    chunks = articles_repository.export_articles(
+        updated_since=updated_since,
+        chunk_size=settings.export_chunk_size,
+    )
+    content = export.iter_csv(chunks) if format == ArticlesExportFormat.csv else export.iter_ndjson(chunks)
+
+    return StreamingResponse(
+        content,
+        status_code=status.HTTP_200_OK,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=articles.{format.value}"},
+    )
@@ -1,18 +1,33 @@
 from typing import Optional
+from asyncpg import Record
 from fastapi import APIRouter, Depends, HTTPException, Body, Response, UploadFile, Form, File
 from starlette import status
+from starlette.requests import Request
 
 from app.controllers.dependencies.authentication import get_current_user_authorizer
 from app.controllers.dependencies.articles import (
     get_articles_filters, 
     check_article_modification_permissions, 
     get_article_by_slug_from_path,
+    get_article_validators_from_path,
+    check_article_read_permissions,
 )
 from app.controllers.dependencies.database import get_repository
-from app.repositories.data.articles import (ArticlesRepository, check_article_exists, get_slug_for_article)
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.repositories.data.articles import (
+    ArticlesRepository,
+    check_article_exists,
+    get_articles_count_from_db_records,
+    get_articles_json_from_db_records,
+    get_next_cursor_for_articles,
+    get_next_cursor_for_articles_rows,
+    get_slug_for_article,
+)
 from app.models.domain.articles import Article
 from app.models.domain.users import User
 from app.models.schemas.articles import (
+    ArticlesCountMode,
     ArticlesFilters,
     ArticleForResponse,
     ResponseListArticles,
@@ -20,23 +35,73 @@ from app.models.schemas.articles import (
     RequestUpdateArticle,
     ResponseArticle,
 )
-from app.toolkit import response, constants, cloud_storage
+from app.toolkit import response, constants, cloud_storage, conditional
 
 router = APIRouter()
 
 @router.get("", name="Get Articles", response_model=ResponseListArticles)
 async def get_articles(
+    request: Request,
     articles_filters: ArticlesFilters = Depends(get_articles_filters),
     current_user: Optional[User] = Depends(get_current_user_authorizer(required=True)),
     articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ResponseListArticles:
     
-    articles = await articles_repository.filter_articles(
+    # estimates only cover the whole table, any filter falls back to an exact count
+    estimate_count = articles_filters.count == ArticlesCountMode.estimate and not (
+        articles_filters.tag or articles_filters.author or articles_filters.favorited
+    )
+
+    # keyset pages come without a total, it was reported with the first page
+    articles_count_mode = None if articles_filters.after else (
+        ArticlesCountMode.estimate if estimate_count else ArticlesCountMode.exact
+    )
+
+    if settings.articles_json_from_db:
+        articles_rows = await articles_repository.filter_articles_json(
+            tag=articles_filters.tag,
+            author=articles_filters.author,
+            favorited=articles_filters.favorited,
+            limit=articles_filters.limit,
+            offset=articles_filters.offset,
+            after=articles_filters.after,
+            estimate_count=estimate_count,
+            requested_user=current_user,
+        )
+
+        if not articles_rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=constants.ARTICLE_DOES_NOT_EXIST_ERROR,
+            )
+
+        articles_response = await response.response_success(
+            status_code=status.HTTP_200_OK,
+            message="Success",
+            data=ResponseListArticles.construct(
+                articles=response.RawJSON(get_articles_json_from_db_records(articles_rows)),
+                articles_count=get_articles_count_from_db_records(articles_rows),
+                articles_count_mode=articles_count_mode,
+                next_cursor=get_next_cursor_for_articles_rows(articles_rows, articles_filters.limit),
+            ),
+            response_class=response.RawJSONResponse,
+        )
+
+        return conditional.conditional_response(
+            request,
+            articles_response,
+            cache_control=conditional.PRIVATE_CACHE_CONTROL,
+        )
+
+    articles, articles_count = await articles_repository.filter_articles(
         tag=articles_filters.tag,
         author=articles_filters.author,
         favorited=articles_filters.favorited,
         limit=articles_filters.limit,
         offset=articles_filters.offset,
+        after=articles_filters.after,
+        estimate_count=estimate_count,
         requested_user=current_user,
     )
 
@@ -47,18 +112,26 @@ async def get_articles(
         )
 
     articles_for_response = [
-        ArticleForResponse.from_orm(article) for article in articles
+        ArticleForResponse.from_validated(article) for article in articles
     ]
 
-    return await response.response_success(
+    articles_response = await response.response_success(
         status_code=status.HTTP_200_OK,
         message="Success",
         data=ResponseListArticles(
             articles=articles_for_response,
-            articles_count=len(articles),
+            articles_count=articles_count,
+            articles_count_mode=articles_count_mode,
+            next_cursor=get_next_cursor_for_articles(articles, articles_filters.limit),
         )
     )
 
+    return conditional.conditional_response(
+        request,
+        articles_response,
+        cache_control=conditional.PRIVATE_CACHE_CONTROL,
+    )
+
 @router.post("", name="Create Article", status_code=status.HTTP_201_CREATED)
 async def create_new_article(
     title: str = Form(...),
@@ -101,15 +174,47 @@ async def create_new_article(
         data=article,
     )
 
-@router.get("/{slug}", name="Get Article", dependencies=[Depends(check_article_modification_permissions)])
+@router.get("/{slug}", name="Get Article", dependencies=[Depends(check_article_read_permissions)])
 async def retrieve_article_by_slug(
-    article: Article = Depends(get_article_by_slug_from_path),
+    request: Request,
+    article_validators: Record = Depends(get_article_validators_from_path),
+    current_user: Optional[User] = Depends(get_current_user_authorizer(required=False)),
+    articles_repository: ArticlesRepository = Depends(get_repository(ArticlesRepository)),
+    settings: AppSettings = Depends(get_app_settings),
 ) -> ResponseArticle:
-    return await response.response_success(
-        status_code= status.HTTP_200_OK, 
-        message= "Success",
-        data= ArticleForResponse.from_orm(article),
+    validator_headers = conditional.get_validator_headers(
+        etag=conditional.make_etag(*article_validators.values()),
+        cache_control=conditional.PRIVATE_CACHE_CONTROL,
     )
+    if conditional.is_not_modified(request, etag=validator_headers["ETag"]):
+        return conditional.not_modified_response(validator_headers)
+
+    if settings.articles_json_from_db:
+        article_json = await articles_repository.get_article_json_by_slug(
+            slug=article_validators["slug"],
+            requested_user=current_user,
+        )
+
+        article_response = await response.response_success(
+            status_code= status.HTTP_200_OK, 
+            message= "Success",
+            data= response.RawJSON(article_json.encode()),
+            response_class= response.RawJSONResponse,
+        )
+    else:
+        article = await articles_repository.get_article_by_slug(
+            slug=article_validators["slug"],
+            requested_user=current_user,
+        )
+
+        article_response = await response.response_success(
+            status_code= status.HTTP_200_OK, 
+            message= "Success",
+            data= ArticleForResponse.from_validated(article),
+        )
+    article_response.headers.update(validator_headers)
+
+    return article_response
 
 @router.put("/{slug}", name="Update Article", dependencies=[Depends(check_article_modification_permissions)])
 async def update_article_by_slug(
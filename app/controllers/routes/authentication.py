@@ -7,8 +7,8 @@ from app.core.settings.app import AppSettings
 from app.controllers.dependencies.database import get_repository
 
 from app.models.schemas.authentication import (RequestLogin, RequestRegister, ResponseAuthentication)
-from app.repositories.data.authentication import (AuthenticationRepository, check_email_is_taken, check_username_is_taken)
-from app.repositories.errors import EntityDoesNotExist
+from app.repositories.data.authentication import AuthenticationRepository
+from app.repositories.errors import EntityAlreadyExists, EntityDoesNotExist
 
 from app.toolkit.response import response_success
 from app.toolkit import constants
@@ -33,7 +33,7 @@ async def login(
     except EntityDoesNotExist as existence_error:
         raise wrong_login_error from existence_error
 
-    if not user.check_password(login_request.password):
+    if not await authentication_repository.verify_user_password(user=user, password=login_request.password):
         raise wrong_login_error
 
     access_token = jwt.create_access_token_for_user(user, str(settings.secret_key.get_secret_value()))
@@ -50,21 +50,15 @@ async def register(
     authentication_repository: AuthenticationRepository = Depends(get_repository(AuthenticationRepository)),
     settings: AppSettings = Depends(get_app_settings),
 ) -> ResponseAuthentication:
-    
-    if await check_username_is_taken(authentication_repository, register_request.username):
-        raise HTTPException(
-            status_code=HTTP_400_BAD_REQUEST,
-            detail=constants.USERNAME_TAKEN,
-        )
 
-    if await check_email_is_taken(authentication_repository, register_request.email):
+    try:
+        user = await authentication_repository.create_user(**register_request.dict())
+    except EntityAlreadyExists as conflict_error:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
-            detail=constants.EMAIL_TAKEN,
+            detail=constants.USERNAME_TAKEN if conflict_error.field == "username" else constants.EMAIL_TAKEN,
         )
 
-    user = await authentication_repository.create_user(**register_request.dict())
-
     access_token = jwt.create_access_token_for_user(user, str(settings.secret_key.get_secret_value()))
 
     return await response_success(
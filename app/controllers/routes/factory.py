@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.controllers.routes import authentication, users, articles_common, articles_resource, media_common, media_resource, reviews, profiles, tags
+from app.controllers.routes import authentication, users, articles_common, articles_resource, media_common, media_resource, reviews, profiles, tags, metrics
 
 router = APIRouter()
 router.include_router(authentication.router, tags=["authentication"], prefix="/authentication")
@@ -12,3 +12,4 @@ router.include_router(media_common.router, tags=["media"], prefix="/media")
 router.include_router(media_resource.router, tags=["media"], prefix="/media")
 router.include_router(reviews.router, tags=["reviews"], prefix="/articles/{slug}/reviews")
 router.include_router(tags.router, tags=["tags"], prefix="/tags")
+router.include_router(metrics.router, tags=["metrics"], prefix="/metrics")
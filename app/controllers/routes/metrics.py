@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+from starlette.requests import Request
+
+from app.controllers.dependencies.authentication import get_current_user_authorizer
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
+from app.repositories.cache import get_articles_cache, get_principals_cache
+from app.toolkit import constants, response
+from app.toolkit.jwt import verified_tokens_cache
+
+def check_metrics_enabled(settings: AppSettings = Depends(get_app_settings)) -> None:
+    # pool sizes and replica lag are for operators, deployments opt in to exposing them
+    if not settings.metrics_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=constants.METRICS_ARE_DISABLED,
+        )
+
+router = APIRouter(
+    dependencies=[Depends(check_metrics_enabled), Depends(get_current_user_authorizer())],
+)
+
+@router.get("", name="Get Metrics")
+async def get_metrics(request: Request) -> dict:
+    replica = request.app.state.replica
+    return await response.response_success(
+        status_code=status.HTTP_200_OK,
+        message="Success",
+        data={
+            "articles_cache": get_articles_cache().get_stats(),
+            "principals_cache": get_principals_cache().get_stats(),
+            "jwt_cache": verified_tokens_cache.get_stats(),
+            "db_pool": request.app.state.pool.get_stats(),
+            "db_replica": replica.get_stats() if replica is not None else None,
+        },
+    )
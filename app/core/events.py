@@ -4,7 +4,14 @@ from fastapi import FastAPI
 from loguru import logger
 
 from app.core.settings.app import AppSettings
-from app.repositories.events import close_db_connection, connect_to_db
+from app.repositories.events import (
+    close_db_connection,
+    connect_to_db,
+    start_articles_cache_listener,
+    start_replica_monitor,
+    stop_articles_cache_listener,
+    stop_replica_monitor,
+)
 
 def create_start_app_handler(
     app: FastAPI,
@@ -12,12 +19,16 @@ def create_start_app_handler(
 ) -> Callable:  # type: ignore
     async def start_app() -> None:
         await connect_to_db(app, settings)
+        await start_articles_cache_listener(app, settings)
+        await start_replica_monitor(app, settings)
 
     return start_app
 
 def create_stop_app_handler(app: FastAPI) -> Callable:  # type: ignore
     @logger.catch
     async def stop_app() -> None:
+        await stop_articles_cache_listener(app)
+        await stop_replica_monitor(app)
         await close_db_connection(app)
 
     return stop_app
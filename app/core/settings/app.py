@@ -26,12 +26,44 @@ class AppSettings(BaseAppSettings):
     db_name: Optional[str] = Field(default=None, env="DBNAME")
 
     database_url: Optional[PostgresDsn] = None
+    replica_database_url: Optional[PostgresDsn] = None
+    replica_max_lag: float = 5
+    replica_check_interval: float = 5
 
     max_connection_count: int = 10
-    min_connection_count: int = 10
+    min_connection_count: int = 2
+    connection_acquire_timeout: float = 5
+    connection_max_idle_time: float = 300
+    connection_max_queries: int = 50000
+    connection_max_age: float = 3600
+    statement_cache_size: int = 256
+    prepare_statements_on_connect: bool = True
+    pgbouncer_mode: bool = False
+
+    timeline_max_length: int = 800
+    timeline_fanout_max_followers: int = 10000
+
+    export_chunk_size: int = 500
+
+    http_cache_max_age: int = 30
+    articles_json_from_db: bool = False
+
+    articles_cache_max_size: int = 10000
+    articles_cache_ttl: int = 60
+    articles_cache_listener_retry_interval: int = 5
+
+    bcrypt_rounds: int = 12
+    password_hashing_max_workers: int = 2
+
+    principal_cache_max_size: int = 10000
+    principal_cache_ttl: int = 30
+    principal_trust_token_claims: bool = False
 
     secret_key: Optional[SecretStr] = Field(default=None, env="JWT")
     secret_key_expired: Optional[int] = Field(default=1440, env="JWT_EXP")
+    jwt_cache_max_size: int = 10000
+
+    metrics_enabled: bool = False
 
     gcp_credential: Optional[str] = Field(default=None, env="GCP_CREDENTIAL")
     gcp_projectid: Optional[str] = Field(default=None, env="GCP_PROJECTID")
@@ -78,6 +110,15 @@ class AppSettings(BaseAppSettings):
 
         return values
 
+    @property
+    def database_statement_cache_size(self) -> int:
+        # pgbouncer in transaction mode cannot keep named statements between transactions
+        return 0 if self.pgbouncer_mode else self.statement_cache_size
+
+    @property
+    def prepare_statements(self) -> bool:
+        return self.prepare_statements_on_connect and not self.pgbouncer_mode
+
     @property
     def fastapi_kwargs(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,35 @@
+import asyncio
+
+import asyncpg
+from loguru import logger
+
+from app.core.config import get_app_settings
+from app.repositories.data.articles import ArticlesRepository
+
+BATCH_SIZE = 1000
+
+async def reconcile_counters(batch_size: int = BATCH_SIZE) -> int:
+    settings = get_app_settings()
+    conn = await asyncpg.connect(
+        str(settings.database_url),
+        statement_cache_size=settings.database_statement_cache_size,
+    )
+
+    try:
+        articles_repo = ArticlesRepository(conn)
+        last_id, total_reconciled = 0, 0
+        while last_id is not None:
+            # every batch commits on its own so the job never holds long row locks
+            last_id, reconciled = await articles_repo.reconcile_counters(
+                after_id=last_id,
+                batch_size=batch_size,
+            )
+            total_reconciled += reconciled
+    finally:
+        await conn.close()
+
+    logger.info("Reconciled counters of {0} articles", total_reconciled)
+    return total_reconciled
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_counters())
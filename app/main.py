@@ -5,7 +5,8 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.core.config import get_app_settings
 from app.core.events import create_start_app_handler, create_stop_app_handler
-from app.toolkit.response import response_error, response_validation_error
+from app.repositories.errors import ConnectionAcquireTimeout
+from app.toolkit.response import response_database_busy, response_error, response_validation_error
 from app.controllers.routes.factory import router as factory_router
 
 def get_application() -> FastAPI:
@@ -34,6 +35,7 @@ def get_application() -> FastAPI:
 
     application.add_exception_handler(HTTPException, response_error)
     application.add_exception_handler(RequestValidationError, response_validation_error)
+    application.add_exception_handler(ConnectionAcquireTimeout, response_database_busy)
 
     application.include_router(factory_router, prefix=settings.api_prefix)
 
@@ -13,4 +13,9 @@ class Article(IDModelMixin, DateTimeModelMixin, BaseModel):
     tags: List[str]
     author: Profile
     favorited: bool
-    favorites_count: int
\ No newline at end of file
+    favorites_count: int
+    reviews_count: int = 0
+
+class ArticleSearchResult(Article):
+    rank: float
+    snippet: str
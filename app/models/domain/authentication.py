@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.toolkit import security
 
@@ -9,12 +9,20 @@ class Authentication(BaseModel):
     salt: str = ""
     hashed_password: str = ""
 
-    def check_password(self, password: str) -> bool:
-        return security.verify_password(self.salt + password, self.hashed_password)
+    async def check_password(self, password: str) -> Tuple[bool, Optional[str]]:
+        return await security.verify_password(self.salt + password, self.hashed_password)
 
-    def change_password(self, password: str) -> None:
+    async def change_password(self, password: str) -> None:
         self.salt = security.generate_salt()
-        self.hashed_password = security.get_password_hash(self.salt + password)
+        self.hashed_password = await security.get_password_hash(self.salt + password)
+
+    class Config:
+        orm_mode = True
+
+# what authorization needs to know about the caller, nothing secret
+class Principal(BaseModel):
+    id: int
+    username: str
 
     class Config:
         orm_mode = True
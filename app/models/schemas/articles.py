@@ -1,13 +1,24 @@
+import datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
 from app.models.schemas.base_schema import BaseSchema
-from app.models.domain.articles import Article
+from app.models.domain.articles import Article, ArticleSearchResult
+from app.toolkit.cursor import Keyset
 
 DEFAULT_ARTICLES_LIMIT = 20
 DEFAULT_ARTICLES_OFFSET = 0
 
+class ArticlesCountMode(str, Enum):
+    exact = "exact"
+    estimate = "estimate"
+
+class ArticlesExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
 class ArticleForResponse(BaseSchema, Article):
     tags: List[str] = Field(..., alias="tag_list")
 
@@ -16,6 +27,16 @@ class ResponseArticle():
 
 class ResponseListArticles(BaseSchema):
     articles: List[ArticleForResponse]
+    # both null on keyset (after=...) pages, only the first page is counted
+    articles_count: Optional[int]
+    articles_count_mode: Optional[ArticlesCountMode] = ArticlesCountMode.exact
+    next_cursor: Optional[str] = None
+
+class ArticleSearchResultForResponse(BaseSchema, ArticleSearchResult):
+    tags: List[str] = Field(..., alias="tag_list")
+
+class ResponseSearchArticles(BaseSchema):
+    articles: List[ArticleSearchResultForResponse]
     articles_count: int
 
 class ArticlesFilters(BaseModel):
@@ -24,6 +45,8 @@ class ArticlesFilters(BaseModel):
     favorited: Optional[str] = None
     limit: int = Field(DEFAULT_ARTICLES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_ARTICLES_OFFSET, ge=0)
+    after: Optional[Keyset] = None
+    count: ArticlesCountMode = ArticlesCountMode.exact
 
 class RequestCreateArticle(BaseSchema):
     title: str
@@ -37,4 +60,23 @@ class RequestUpdateArticle(BaseSchema):
     description: str
     body: str
     image: str
-    # tags: List[str] = Field([], alias="tagList")
\ No newline at end of file
+    # tags: List[str] = Field([], alias="tagList")
+
+class RequestImportArticle(BaseSchema):
+    slug: Optional[str] = None
+    title: str
+    description: str
+    body: str
+    image: str
+    author: Optional[str] = None
+    tags: List[str] = Field([], alias="tagList")
+    created_at: Optional[datetime.datetime] = None
+
+class ArticleImportFailure(BaseSchema):
+    line: int
+    slug: Optional[str] = None
+    error: str
+
+class ResponseImportArticles(BaseSchema):
+    imported_count: int
+    failures: List[ArticleImportFailure]
@@ -1,5 +1,18 @@
+from typing import Type, TypeVar
+
+from pydantic import BaseModel as PydanticModel
+
 from app.models.domain.base_model import BaseModel
 
+SchemaT = TypeVar("SchemaT", bound="BaseSchema")
+
 class BaseSchema(BaseModel):
     class Config(BaseModel.Config):
         orm_mode = True
+        # schemas nested in a response envelope are used as they are, not copied again
+        copy_on_model_validation = "none"
+
+    @classmethod
+    def from_validated(cls: Type[SchemaT], model: PydanticModel) -> SchemaT:
+        # model already went through validation when it was loaded, only its class changes here
+        return cls.construct(_fields_set=model.__fields_set__, **dict(model))
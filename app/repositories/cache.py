@@ -0,0 +1,143 @@
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import get_app_settings
+from app.models.domain.articles import Article
+from app.models.domain.authentication import Principal
+from app.toolkit.cache import TTLCache
+
+ARTICLE_CHANGES_CHANNEL = "article_changes"
+SLUG_CHANGE_PREFIX = "slug:"
+AUTHOR_CHANGE_PREFIX = "author:"
+ROLES_CHANGE_PAYLOAD = "roles"
+
+ArticleCacheKey = Tuple[str, Optional[str]]
+
+class ArticlesCache(TTLCache[ArticleCacheKey, Article]):
+    # articles carry the reader's favorited and following flags, so entries are
+    # kept per (slug, requested username) and indexed for invalidation by slug and author
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._keys_by_slug: Dict[str, Set[ArticleCacheKey]] = {}
+        self._keys_by_author: Dict[str, Set[ArticleCacheKey]] = {}
+
+    def get_article(self, *, slug: str, requested_username: Optional[str]) -> Optional[Article]:
+        return self.get((slug, requested_username))
+
+    def set_article(
+        self,
+        *,
+        article: Article,
+        requested_username: Optional[str],
+        version: int,
+    ) -> None:
+        key = (article.slug, requested_username)
+        if key in self._entries:
+            self._remove(key)
+
+        self.set(key, article, version=version)
+        if key in self._entries:
+            self._keys_by_slug.setdefault(article.slug, set()).add(key)
+            self._keys_by_author.setdefault(article.author.username, set()).add(key)
+
+    def invalidate_slug(self, slug: str) -> None:
+        self.version += 1
+        for key in list(self._keys_by_slug.get(slug, ())):
+            self._remove(key)
+
+    def invalidate_author(self, username: str) -> None:
+        self.version += 1
+        for key in list(self._keys_by_author.get(username, ())):
+            self._remove(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys_by_slug.clear()
+        self._keys_by_author.clear()
+
+    def _remove(self, key: ArticleCacheKey) -> None:
+        article = self._entries[key][1]
+        super()._remove(key)
+        self._discard_index(self._keys_by_slug, article.slug, key)
+        self._discard_index(self._keys_by_author, article.author.username, key)
+
+    def _discard_index(
+        self,
+        index: Dict[str, Set[ArticleCacheKey]],
+        index_key: str,
+        key: ArticleCacheKey,
+    ) -> None:
+        keys = index.get(index_key)
+        if keys is None:
+            return
+
+        keys.discard(key)
+        if not keys:
+            del index[index_key]
+
+# the handful of roles, by name, loaded whole and reloaded whole after any change
+class RolesCache:
+    def __init__(self) -> None:
+        self._ids_by_name: Optional[Dict[int, int]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._ids_by_name is not None
+
+    def load(self, ids_by_name: Dict[int, int]) -> None:
+        self._ids_by_name = ids_by_name
+
+    def get_role_id(self, name: int) -> Optional[int]:
+        return (self._ids_by_name or {}).get(name)
+
+    def set_role_id(self, name: int, role_id: int) -> None:
+        if self._ids_by_name is not None:
+            self._ids_by_name[name] = role_id
+
+    def clear(self) -> None:
+        self._ids_by_name = None
+
+@lru_cache
+def get_articles_cache() -> ArticlesCache:
+    settings = get_app_settings()
+    articles_cache = ArticlesCache(
+        max_size=settings.articles_cache_max_size,
+        ttl=settings.articles_cache_ttl,
+    )
+    # stays off until the change listener is connected
+    articles_cache.enabled = False
+    return articles_cache
+
+@lru_cache
+def get_principals_cache() -> TTLCache[str, Principal]:
+    settings = get_app_settings()
+    principals_cache: TTLCache[str, Principal] = TTLCache(
+        max_size=settings.principal_cache_max_size,
+        ttl=settings.principal_cache_ttl,
+    )
+    principals_cache.enabled = False
+    return principals_cache
+
+@lru_cache
+def get_roles_cache() -> RolesCache:
+    return RolesCache()
+
+def set_caches_enabled(enabled: bool) -> None:
+    for cache in (get_articles_cache(), get_principals_cache()):
+        # whatever changed while nobody was listening is unknown, so always start empty
+        cache.clear()
+        cache.enabled = enabled
+
+def handle_change(payload: str) -> None:
+    if payload.startswith(SLUG_CHANGE_PREFIX):
+        get_articles_cache().invalidate_slug(payload[len(SLUG_CHANGE_PREFIX):])
+    elif payload.startswith(AUTHOR_CHANGE_PREFIX):
+        username = payload[len(AUTHOR_CHANGE_PREFIX):]
+        get_articles_cache().invalidate_author(username)
+        get_principals_cache().pop(username)
+    elif payload == ROLES_CHANGE_PAYLOAD:
+        get_roles_cache().clear()
+    else:
+        get_articles_cache().clear()
+        get_principals_cache().clear()
+        get_roles_cache().clear()
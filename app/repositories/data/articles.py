@@ -1,27 +1,59 @@
-from typing import List, Optional, Union, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union, Sequence
 
 from asyncpg import Connection, Record 
-from pypika import Query
+from pypika import Query, Tuple as SQLTuple, functions as fn
+from pypika.terms import Star
 from slugify import slugify
 
 from app.models.domain.profiles import Profile
+from app.repositories.cache import get_articles_cache
 from app.repositories.errors import EntityDoesNotExist
 from app.repositories.queries.queries import queries
 from app.repositories.data.base import BaseRepository
 from app.repositories.queries.tables import (
+    Array,
+    ArticlesCountEstimate,
+    Exists,
+    JSONBuildObject,
+    JSONTimestamp,
     Parameter,
     articles,
     articles_to_tags,
     favorites,
+    followers_to_followings,
     tags as tags_table,
     users,
 )
-from app.models.domain.articles import Article
+from app.models.domain.articles import Article, ArticleSearchResult
 from app.models.domain.users import User
 from app.repositories.data.profiles import ProfilesRepository
+from app.repositories.data.tags import TagsRepository
+from app.repositories.data.timelines import TimelinesRepository
+from app.toolkit.cursor import Keyset, encode_cursor
 
 AUTHOR_USERNAME_ALIAS = "author_username"
 SLUG_ALIAS = "slug"
+TAGS_ALIAS = "tags"
+FAVORITES_COUNT_ALIAS = "favorites_count"
+REVIEWS_COUNT_ALIAS = "reviews_count"
+FAVORITED_ALIAS = "favorited"
+ARTICLES_COUNT_ALIAS = "articles_count"
+ARTICLE_JSON_ALIAS = "article"
+
+ARTICLES_IMPORT_TABLE = "articles_import"
+ARTICLES_IMPORT_COLUMNS = (
+    "line_number",
+    "slug",
+    "title",
+    "description",
+    "body",
+    "image",
+    "author_username",
+    "tags",
+    "created_at",
+)
 
 CAMEL_OR_SNAKE_CASE_TO_WORDS = r"^[a-z\d_\-]+|[A-Z\d_\-][^A-Z\d_\-]*"
 
@@ -29,6 +61,9 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
     def __init__(self, conn: Connection) -> None:
         super().__init__(conn)
         self._profiles_repo = ProfilesRepository(conn)
+        self._tags_repo = TagsRepository(conn)
+        self._timelines_repo = TimelinesRepository(conn)
+        self._articles_cache = get_articles_cache()
 
     async def create_article(  # noqa: WPS211
         self,
@@ -41,27 +76,37 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         author: User,
         tags: Optional[Sequence[str]] = None,
     ) -> Article:
-        async with self.connection.transaction():
-            article_row = await queries.create_new_article(
-                self.connection,
-                slug=slug,
-                title=title,
-                description=description,
-                image=image,
-                body=body,
-                author_username=author.username,
-            )
+        # the author profile is read on the connection the article was written on
+        async with self.unit_of_work():
+            async with self.connection.transaction():
+                article_row = await queries.create_new_article(
+                    self.connection,
+                    slug=slug,
+                    title=title,
+                    description=description,
+                    image=image,
+                    body=body,
+                    author_username=author.username,
+                    tags=sorted(set(tags or [])),
+                )
 
-            if tags:
-                await self._tags_repo.create_tags_that_dont_exist(tags=tags)
-                await self._link_article_with_tags(slug=slug, tags=tags)
+                if tags:
+                    await self._tags_repo.create_tags_and_link_to_article(
+                        article_id=article_row["id"],
+                        tags=tags,
+                    )
 
-        return await self._get_article_from_db_record(
-            article_row=article_row,
-            slug=slug,
-            author_username=article_row[AUTHOR_USERNAME_ALIAS],
-            requested_user=author,
-        )
+                await self._timelines_repo.fan_out_article(
+                    article_id=article_row["id"],
+                    created_at=article_row["created_at"],
+                )
+
+            return await self._get_article_from_db_record(
+                article_row=article_row,
+                slug=slug,
+                author_username=article_row[AUTHOR_USERNAME_ALIAS],
+                requested_user=author,
+            )
 
     async def update_article(  # noqa: WPS211
         self,
@@ -92,6 +137,9 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
                 new_description=updated_article.description,
             )
 
+        # the trigger notification reaches every worker, this one should not wait for it
+        self._articles_cache.invalidate_slug(article.slug)
+
         return updated_article
 
     async def delete_article(self, *, article: Article) -> None:
@@ -102,27 +150,50 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
                 author_username=article.author.username,
             )
 
+        self._articles_cache.invalidate_slug(article.slug)
+
     async def get_articles_for_feed(
         self,
         *,
         limit: int = 20,
         offset: int = 0,
-        requested_user: User,
-    ) -> List[Article]:
-        articles_rows = await queries.get_articles_for_feed(
-            self.connection,
-            limit=limit,
-            offset=offset,
-        )
-        return [
-            await self._get_article_from_db_record(
-                article_row=article_row,
-                slug=article_row[SLUG_ALIAS],
-                author_username=article_row[AUTHOR_USERNAME_ALIAS],
+        after: Optional[Keyset] = None,
+        estimate_count: bool = False,
+        requested_user: Optional[User] = None,
+    ) -> Tuple[List[Article], Optional[int]]:
+        async with self.read_only():
+            # timelines are bounded by timeline_max_length, so they are always counted exactly
+            if requested_user:
+                articles_rows = await self._timelines_repo.get_timeline_rows(
+                    requested_user=requested_user,
+                    limit=limit,
+                    offset=offset,
+                    after=after,
+                )
+            elif after:
+                after_created_at, after_id = after
+                articles_rows = await queries.get_articles_for_feed_after(
+                    self.connection,
+                    requested_username=None,
+                    after_created_at=after_created_at,
+                    after_id=after_id,
+                    limit=limit,
+                )
+            else:
+                articles_rows = await queries.get_articles_for_feed(
+                    self.connection,
+                    requested_username=None,
+                    exact_count=not estimate_count,
+                    limit=limit,
+                    offset=offset,
+                )
+
+            articles = await self._get_articles_from_db_records(
+                articles_rows=articles_rows,
                 requested_user=requested_user,
             )
-            for article_row in articles_rows
-        ]
+
+        return articles, get_articles_count_from_db_records(articles_rows)
 
     async def filter_articles(  # noqa: WPS211
         self,
@@ -132,101 +203,198 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         favorited: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        after: Optional[Keyset] = None,
+        estimate_count: bool = False,
         requested_user: Optional[User] = None,
-    ) -> List[Article]:
-        query_params: List[Union[str, int]] = []
-        query_params_count = 0
+    ) -> Tuple[List[Article], Optional[int]]:
+        async with self.read_only():
+            articles_rows = await self._fetch_filtered_articles(
+                tag=tag,
+                author=author,
+                favorited=favorited,
+                limit=limit,
+                offset=offset,
+                after=after,
+                estimate_count=estimate_count,
+                requested_user=requested_user,
+            )
+            # authors are hydrated on the server the page was read from
+            articles = await self._get_articles_from_db_records(
+                articles_rows=articles_rows,
+                requested_user=requested_user,
+            )
 
-        # fmt: off
-        query = Query.from_(
-            articles,
-        ).select(
-            articles.id,
-            articles.slug,
-            articles.title,
-            articles.description,
-            articles.body,
-            articles.image,
-            articles.created_at,
-            articles.updated_at,
-            Query.from_(
-                users,
-            ).where(
-                users.id == articles.author_id,
-            ).select(
-                users.username,
-            ).as_(
-                AUTHOR_USERNAME_ALIAS,
-            ),
-        )
-        # fmt: on
+        return articles, get_articles_count_from_db_records(articles_rows)
 
-        if tag:
-            query_params.append(tag)
-            query_params_count += 1
-
-            # fmt: off
-            query = query.join(
-                articles_to_tags,
-            ).on(
-                (articles.id == articles_to_tags.article_id) & (
-                    articles_to_tags.tag == Query.from_(
-                        tags_table,
-                    ).where(
-                        tags_table.tag == Parameter(query_params_count),
-                    ).select(
-                        tags_table.tag,
-                    )
-                ),
+    async def filter_articles_json(  # noqa: WPS211
+        self,
+        *,
+        tag: Optional[str] = None,
+        author: Optional[str] = None,
+        favorited: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Keyset] = None,
+        estimate_count: bool = False,
+        requested_user: Optional[User] = None,
+    ) -> List[Record]:
+        # same page as filter_articles, every article already rendered by Postgres
+        async with self.read_only():
+            return await self._fetch_filtered_articles(
+                tag=tag,
+                author=author,
+                favorited=favorited,
+                limit=limit,
+                offset=offset,
+                after=after,
+                estimate_count=estimate_count,
+                requested_user=requested_user,
+                as_json=True,
             )
-            # fmt: on
 
+    async def _fetch_filtered_articles(  # noqa: WPS211
+        self,
+        *,
+        tag: Optional[str],
+        author: Optional[str],
+        favorited: Optional[str],
+        limit: int,
+        offset: int,
+        after: Optional[Keyset],
+        estimate_count: bool,
+        requested_user: Optional[User],
+        as_json: bool = False,
+    ) -> List[Record]:
+        # same order compile_filter_articles_query numbers its parameters in
+        query_params: List[Union[str, int, datetime, None]] = [
+            requested_user.username if requested_user else None,
+        ]
+        if tag:
+            query_params.append(tag)
         if author:
             query_params.append(author)
-            query_params_count += 1
+        if favorited:
+            query_params.append(favorited)
+        if after:
+            query_params.extend(after)
+        query_params.append(limit)
+        if not after:
+            query_params.append(offset)
 
-            # fmt: off
-            query = query.join(
-                users,
-            ).on(
-                (articles.author_id == users.id) & (
-                    users.id == Query.from_(
-                        users,
-                    ).where(
-                        users.username == Parameter(query_params_count),
-                    ).select(
-                        users.id,
-                    )
-                ),
+        query = compile_filter_articles_query(
+            tag=bool(tag),
+            author=bool(author),
+            favorited=bool(favorited),
+            after=bool(after),
+            # statistics only describe the whole table, filtered sets are always counted
+            exact_count=not estimate_count or bool(tag or author or favorited),
+            as_json=as_json,
+        )
+        return await self.connection.fetch(query, *query_params)
+
+    async def import_articles(self, *, records: Sequence[Sequence[Any]]) -> List[Record]:
+        # rows are laid out as ARTICLES_IMPORT_COLUMNS, failed lines are returned with a reason
+        async with self.connection.transaction():
+            await queries.create_articles_import_table(self.connection)
+            await self.connection.copy_records_to_table(
+                ARTICLES_IMPORT_TABLE,
+                records=records,
+                columns=ARTICLES_IMPORT_COLUMNS,
             )
-            # fmt: on
+            failed_rows = await queries.import_staged_articles(self.connection)
+            await self._timelines_repo.fan_out_imported_articles()
 
-        if favorited:
-            query_params.append(favorited)
-            query_params_count += 1
-
-            # fmt: off
-            query = query.join(
-                favorites,
-            ).on(
-                (articles.id == favorites.article_id) & (
-                    favorites.user_id == Query.from_(
-                        users,
-                    ).where(
-                        users.username == Parameter(query_params_count),
-                    ).select(
-                        users.id,
-                    )
-                ),
+        return failed_rows
+
+    async def export_articles(
+        self,
+        *,
+        updated_since: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[List[Record]]:
+        # a server-side cursor keeps at most chunk_size rows in memory at a time. aiosql
+        # prepares the cursor statement before opening its own transaction, the outer one
+        # keeps both on one server connection behind pgbouncer in transaction mode
+        async with self.read_only() as connection:
+            async with connection.transaction(isolation="repeatable_read", readonly=True):
+                async with queries.get_articles_for_export_cursor(
+                    self.connection,
+                    updated_since=updated_since,
+                ) as cursor_factory:
+                    cursor = await cursor_factory
+                    while True:
+                        articles_rows = await cursor.fetch(chunk_size)
+                        if not articles_rows:
+                            break
+
+                        yield articles_rows
+
+    async def search_articles(
+        self,
+        *,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        requested_user: Optional[User] = None,
+    ) -> List[ArticleSearchResult]:
+        async with self.read_only():
+            articles_rows = await queries.search_articles(
+                self.connection,
+                query=query,
+                limit=limit,
+                offset=offset,
+                requested_username=requested_user.username if requested_user else None,
+            )
+            articles = await self._get_articles_from_db_records(
+                articles_rows=articles_rows,
+                requested_user=requested_user,
             )
-            # fmt: on
 
-        query = query.limit(Parameter(query_params_count + 1)).offset(
-            Parameter(query_params_count + 2),
-        )
-        query_params.extend([limit, offset])
+        return [
+            ArticleSearchResult(
+                **dict(article),
+                rank=article_row["rank"],
+                snippet=article_row["snippet"],
+            )
+            for article, article_row in zip(articles, articles_rows)
+        ]
 
-        articles_rows = await self.connection.fetch(query.get_sql(), *query_params)
+    async def reconcile_counters(
+        self,
+        *,
+        after_id: int = 0,
+        batch_size: int = 1000,
+    ) -> Tuple[Optional[int], int]:
+        # counting in the statement that locks the batch would use a snapshot from
+        # before the lock, and overwrite counters bumped by triggers in between
+        async with self.connection.transaction():
+            batch_rows = await queries.lock_articles_batch_for_reconcile(
+                self.connection,
+                after_id=after_id,
+                batch_size=batch_size,
+            )
+            if not batch_rows:
+                return None, 0
+
+            article_ids = [batch_row["id"] for batch_row in batch_rows]
+            reconcile_row = await queries.reconcile_article_counters(
+                self.connection,
+                article_ids=article_ids,
+            )
+
+        return article_ids[-1], reconcile_row["reconciled_count"]
+
+    async def _get_articles_from_db_records(
+        self,
+        *,
+        articles_rows: Sequence[Record],
+        requested_user: Optional[User],
+    ) -> List[Article]:
+        # resolve every author on the page in one query, rows below hit the memo
+        await self._profiles_repo.get_profiles_by_usernames(
+            usernames=[article_row[AUTHOR_USERNAME_ALIAS] for article_row in articles_rows],
+            requested_user=requested_user,
+        )
 
         return [
             await self._get_article_from_db_record(
@@ -253,15 +421,14 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
             description=article_row["description"],
             body=article_row["body"],
             image=article_row["image"],
-            tags=[],
+            tags=article_row[TAGS_ALIAS],
             author=await self._profiles_repo.get_profile_by_username(
                 username=author_username,
                 requested_user=requested_user,
             ),
-            favorited=False,
-            favorites_count=0
-            if requested_user
-            else False,
+            favorited=article_row[FAVORITED_ALIAS],
+            favorites_count=article_row[FAVORITES_COUNT_ALIAS],
+            reviews_count=article_row[REVIEWS_COUNT_ALIAS],
             created_at=article_row["created_at"],
             updated_at=article_row["updated_at"],
         )
@@ -272,17 +439,353 @@ class ArticlesRepository(BaseRepository):  # noqa: WPS214
         slug: str,
         requested_user: Optional[User] = None,
     ) -> Article:
-        article_row = await queries.get_article_by_slug(self.connection, slug=slug)
+        requested_username = requested_user.username if requested_user else None
+        article = self._articles_cache.get_article(slug=slug, requested_username=requested_username)
+        if article:
+            return article
+
+        cache_version = self._articles_cache.version
+        async with self.unit_of_work():
+            article_row = await queries.get_article_by_slug(
+                self.connection,
+                slug=slug,
+                requested_username=requested_username,
+            )
+            if article_row:
+                article = await self._get_article_from_db_record(
+                    article_row=article_row,
+                    slug=article_row[SLUG_ALIAS],
+                    author_username=article_row[AUTHOR_USERNAME_ALIAS],
+                    requested_user=requested_user,
+                )
+                self._articles_cache.set_article(
+                    article=article,
+                    requested_username=requested_username,
+                    version=cache_version,
+                )
+                return article
+
+        raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
+
+    async def get_article_json_by_slug(
+        self,
+        *,
+        slug: str,
+        requested_user: Optional[User] = None,
+    ) -> str:
+        # rendered by Postgres on every call, the articles cache only holds models
+        requested_username = requested_user.username if requested_user else None
+        async with self.read_only():
+            article_row = await queries.get_article_json_by_slug(
+                self.connection,
+                slug=slug,
+                requested_username=requested_username,
+            )
+        if not article_row and self.last_read_from_replica:
+            # a replica may not have replayed an article created a moment ago
+            article_row = await queries.get_article_json_by_slug(
+                self.connection,
+                slug=slug,
+                requested_username=requested_username,
+            )
         if article_row:
-            return await self._get_article_from_db_record(
-                article_row=article_row,
-                slug=article_row[SLUG_ALIAS],
-                author_username=article_row[AUTHOR_USERNAME_ALIAS],
-                requested_user=requested_user,
+            return article_row[ARTICLE_JSON_ALIAS]
+
+        raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
+
+    async def get_article_validators_by_slug(
+        self,
+        *,
+        slug: str,
+        requested_user: Optional[User] = None,
+    ) -> Record:
+        # everything a response for this user depends on, without hydrating the article
+        requested_username = requested_user.username if requested_user else None
+        async with self.read_only():
+            validators_row = await queries.get_article_validators_by_slug(
+                self.connection,
+                slug=slug,
+                requested_username=requested_username,
+            )
+        if not validators_row and self.last_read_from_replica:
+            # a replica may not have replayed an article created a moment ago
+            validators_row = await queries.get_article_validators_by_slug(
+                self.connection,
+                slug=slug,
+                requested_username=requested_username,
             )
+        if validators_row:
+            return validators_row
 
         raise EntityDoesNotExist("article with slug {0} does not exist".format(slug))
-    
+
+# the SQL text only depends on which filters are present, so every shape is
+# built once and then reused by asyncpg's per-connection prepared statements
+@lru_cache(maxsize=None)
+def compile_filter_articles_query(  # noqa: WPS211
+    *,
+    tag: bool,
+    author: bool,
+    favorited: bool,
+    after: bool,
+    exact_count: bool = True,
+    as_json: bool = False,
+) -> str:
+    params_count = 1
+
+    # fmt: off
+    matched_articles = Query.from_(
+        articles,
+    ).select(
+        articles.id,
+        articles.created_at,
+    )
+    # fmt: on
+
+    if tag:
+        params_count += 1
+
+        # fmt: off
+        matched_articles = matched_articles.join(
+            articles_to_tags,
+        ).on(
+            (articles.id == articles_to_tags.article_id) & (
+                articles_to_tags.tag == Query.from_(
+                    tags_table,
+                ).where(
+                    tags_table.tag == Parameter(params_count),
+                ).select(
+                    tags_table.tag,
+                )
+            ),
+        )
+        # fmt: on
+
+    if author:
+        params_count += 1
+
+        # fmt: off
+        matched_articles = matched_articles.join(
+            users,
+        ).on(
+            (articles.author_id == users.id) & (
+                users.id == Query.from_(
+                    users,
+                ).where(
+                    users.username == Parameter(params_count),
+                ).select(
+                    users.id,
+                )
+            ),
+        )
+        # fmt: on
+
+    if favorited:
+        params_count += 1
+
+        # fmt: off
+        matched_articles = matched_articles.join(
+            favorites,
+        ).on(
+            (articles.id == favorites.article_id) & (
+                favorites.user_id == Query.from_(
+                    users,
+                ).where(
+                    users.username == Parameter(params_count),
+                ).select(
+                    users.id,
+                )
+            ),
+        )
+        # fmt: on
+
+    matched_articles = matched_articles.as_("matched")
+    articles_to_tags_subquery = articles_to_tags.as_("att")
+    favorites_subquery = favorites.as_("f")
+
+    # fmt: off
+    tags_column = Array(
+        Query.from_(
+            articles_to_tags_subquery,
+        ).where(
+            articles_to_tags_subquery.article_id == articles.id,
+        ).select(
+            articles_to_tags_subquery.tag,
+        ).orderby(
+            articles_to_tags_subquery.tag,
+        ),
+    )
+    favorited_column = Exists(
+        Query.from_(
+            favorites_subquery,
+        ).where(
+            (favorites_subquery.article_id == articles.id) & (
+                favorites_subquery.user_id == Query.from_(
+                    users,
+                ).where(
+                    users.username == Parameter(1),
+                ).select(
+                    users.id,
+                )
+            ),
+        ).select(
+            1,
+        ),
+    )
+    # fmt: on
+
+    if as_json:
+        columns = [
+            articles.id,
+            articles.created_at,
+            get_article_json_column(tags_column=tags_column, favorited_column=favorited_column),
+        ]
+    else:
+        # fmt: off
+        columns = [
+            articles.id,
+            articles.slug,
+            articles.title,
+            articles.description,
+            articles.body,
+            articles.image,
+            articles.created_at,
+            articles.updated_at,
+            Query.from_(
+                users,
+            ).where(
+                users.id == articles.author_id,
+            ).select(
+                users.username,
+            ).as_(
+                AUTHOR_USERNAME_ALIAS,
+            ),
+            tags_column.as_(TAGS_ALIAS),
+            articles.favorites_count,
+            articles.reviews_count,
+            favorited_column.as_(FAVORITED_ALIAS),
+        ]
+        # fmt: on
+
+    # keyset pages leave the total out, counting them would visit every match again
+    # for each page, the first page already reported it
+    if after:
+        count_columns = []
+    elif exact_count:
+        # a separate aggregate, the page itself still stops after limit rows
+        count_columns = [
+            Query.from_(
+                matched_articles,
+            ).select(
+                fn.Count(Star()),
+            ).as_(
+                ARTICLES_COUNT_ALIAS,
+            ),
+        ]
+    else:
+        count_columns = [ArticlesCountEstimate(alias=ARTICLES_COUNT_ALIAS)]
+
+    query = Query.from_(
+        articles,
+    ).select(
+        *columns,
+        *count_columns,
+    )
+
+    # an unfiltered page has nothing to take from the matched set
+    if params_count > 1:
+        query = query.join(matched_articles).on(articles.id == matched_articles.id)
+
+    if after:
+        params_count += 2
+
+        # fmt: off
+        query = query.where(
+            SQLTuple(articles.created_at, articles.id) > SQLTuple(
+                Parameter(params_count - 1),
+                Parameter(params_count),
+            ),
+        )
+        # fmt: on
+
+    query = query.orderby(articles.created_at, articles.id)
+
+    params_count += 1
+    query = query.limit(Parameter(params_count))
+
+    # keyset pages never skip rows, offset is only kept for older clients
+    if not after:
+        params_count += 1
+        query = query.offset(Parameter(params_count))
+
+    return query.get_sql()
+
+def get_article_json_column(*, tags_column: Array, favorited_column: Exists) -> JSONBuildObject:
+    # the shape ArticleForResponse renders, requested user is always the first parameter
+    authors = users.as_("u")
+    followings_subquery = followers_to_followings.as_("ftf")
+
+    # fmt: off
+    author_json = Query.from_(
+        authors,
+    ).where(
+        authors.id == articles.author_id,
+    ).select(
+        JSONBuildObject({
+            "username": authors.username,
+            "bio": authors.bio,
+            "image": authors.image,
+            "following": Exists(
+                Query.from_(
+                    followings_subquery,
+                ).where(
+                    (followings_subquery.following_id == authors.id) & (
+                        followings_subquery.follower_id == Query.from_(
+                            users,
+                        ).where(
+                            users.username == Parameter(1),
+                        ).select(
+                            users.id,
+                        )
+                    ),
+                ).select(
+                    1,
+                ),
+            ),
+        }),
+    )
+    # fmt: on
+
+    return JSONBuildObject(
+        {
+            "createdAt": JSONTimestamp(articles.created_at),
+            "updatedAt": JSONTimestamp(articles.updated_at),
+            "id": articles.id,
+            "slug": articles.slug,
+            "title": articles.title,
+            "description": articles.description,
+            "body": articles.body,
+            "image": articles.image,
+            "tag_list": tags_column,
+            "author": author_json,
+            "favorited": favorited_column,
+            "favoritesCount": articles.favorites_count,
+            "reviewsCount": articles.reviews_count,
+        },
+        alias=ARTICLE_JSON_ALIAS,
+    )
+
+def get_articles_count_from_db_records(articles_rows: List[Record]) -> Optional[int]:
+    # every row of a page carries the same total, an empty page has nothing to count
+    # and keyset pages are not counted at all
+    if not articles_rows:
+        return 0
+
+    return articles_rows[0].get(ARTICLES_COUNT_ALIAS)
+
+def get_articles_json_from_db_records(articles_rows: Sequence[Record]) -> bytes:
+    return "[{0}]".format(",".join(article_row[ARTICLE_JSON_ALIAS] for article_row in articles_rows)).encode()
+
 async def check_article_exists(articles_repo: ArticlesRepository, slug: str) -> bool:
     try:
         await articles_repo.get_article_by_slug(slug=slug)
@@ -291,6 +794,20 @@ async def check_article_exists(articles_repo: ArticlesRepository, slug: str) ->
 
     return True
 
+def get_next_cursor_for_articles(articles: Sequence[Article], limit: int) -> Optional[str]:
+    if len(articles) < limit:
+        return None
+
+    last_article = articles[-1]
+    return encode_cursor(last_article.created_at, last_article.id_)
+
+def get_next_cursor_for_articles_rows(articles_rows: Sequence[Record], limit: int) -> Optional[str]:
+    if len(articles_rows) < limit:
+        return None
+
+    last_article_row = articles_rows[-1]
+    return encode_cursor(last_article_row["created_at"], last_article_row["id"])
+
 def get_slug_for_article(title: str) -> str:
     return slugify(title)
 
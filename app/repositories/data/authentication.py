@@ -1,9 +1,21 @@
-from app.models.domain.authentication import Authentication
-from app.repositories.errors import EntityDoesNotExist
+from asyncpg import Connection, ForeignKeyViolationError, Record, UniqueViolationError
+
+from app.models.domain.authentication import Authentication, Principal
+from app.repositories.errors import EntityAlreadyExists, EntityDoesNotExist
 from app.repositories.data.base import BaseRepository
+from app.repositories.data.roles import RolesRepository
 from app.repositories.queries.queries import queries
 
+USERS_UNIQUE_CONSTRAINTS = {
+    "ix_users_username": "username",
+    "ix_users_email": "email",
+}
+
 class AuthenticationRepository(BaseRepository):
+    def __init__(self, conn: Connection) -> None:
+        super().__init__(conn)
+        self._roles_repo = RolesRepository(conn)
+
     async def get_user_by_email(self, *, email: str) -> Authentication:
         user_row = await queries.get_user_by_email(self.connection, email=email)
         if user_row:
@@ -18,54 +30,61 @@ class AuthenticationRepository(BaseRepository):
         if user_row:
             return Authentication(**user_row)
         raise EntityDoesNotExist("user with username {0} does not exist".format(username))
-    
-    async def create_user(self, *, username: str, email: str, password: str, role: int) -> Authentication:
-        user = Authentication(username=username, email=email)
-        user.change_password(password)
 
-        tx = self.connection.transaction()
-        await tx.start()
-
-        try:
-            user_row = await queries.create_new_user(
+    async def get_principal_by_username(self, *, username: str) -> Principal:
+        async with self.read_only():
+            principal_row = await queries.get_principal_by_username(
                 self.connection,
                 username=username,
-                email=email,
-                salt=user.salt,
-                hashed_password=user.hashed_password,
             )
-            user_id = user_row["id"]
-
-            role_row_id = await queries.create_new_role(
+        if not principal_row and self.last_read_from_replica:
+            # a replica may not have replayed a signup from a moment ago
+            principal_row = await queries.get_principal_by_username(
                 self.connection,
-                name=role,
+                username=username,
             )
-            role_id = role_row_id
+        if principal_row:
+            return Principal(**principal_row)
+        raise EntityDoesNotExist("user with username {0} does not exist".format(username))
 
-            await queries.create_new_user_to_role(
-                conn=self.connection,
-                user_id=user_id,
-                role_id=role_id
+    async def verify_user_password(self, *, user: Authentication, password: str) -> bool:
+        is_valid, new_hashed_password = await user.check_password(password)
+        # stored hashes are moved to the configured bcrypt cost as users log in
+        if is_valid and new_hashed_password:
+            await queries.update_user_hashed_password(
+                self.connection,
+                id=user.id,
+                hashed_password=new_hashed_password,
             )
+            user.hashed_password = new_hashed_password
 
-            await tx.commit()
+        return is_valid
+    
+    async def create_user(self, *, username: str, email: str, password: str, role: int) -> Authentication:
+        user = Authentication(username=username, email=email)
+        await user.change_password(password)
 
-            return user.copy(update=dict(user_row))
+        try:
+            user_row = await self._create_user_with_role(user=user, role=role)
+        except ForeignKeyViolationError:
+            # the cached role id was deleted meanwhile, reload the roles once and retry
+            await self._roles_repo.load_roles()
+            user_row = await self._create_user_with_role(user=user, role=role)
 
-        except Exception as e:
-            await tx.rollback()
-            raise e
-    
-async def check_username_is_taken(authentication_repository: AuthenticationRepository, username: str) -> bool:
-    try:
-        await authentication_repository.get_user_by_username(username=username)
-        return True
-    except EntityDoesNotExist:
-        return False
+        return user.copy(update=dict(user_row))
 
-async def check_email_is_taken(authentication_repository: AuthenticationRepository, email: str) -> bool:
-    try:
-        await authentication_repository.get_user_by_email(email=email)
-        return True
-    except EntityDoesNotExist:
-        return False
\ No newline at end of file
+    async def _create_user_with_role(self, *, user: Authentication, role: int) -> Record:
+        try:
+            return await queries.create_new_user_with_role(
+                self.connection,
+                username=user.username,
+                email=user.email,
+                salt=user.salt,
+                hashed_password=user.hashed_password,
+                role_id=await self._roles_repo.get_role_id(name=role),
+            )
+        except UniqueViolationError as unique_error:
+            field = USERS_UNIQUE_CONSTRAINTS.get(unique_error.constraint_name)
+            if field is None:
+                raise
+            raise EntityAlreadyExists(field) from unique_error
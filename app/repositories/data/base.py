@@ -1,9 +1,32 @@
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Union
+
 from asyncpg.connection import Connection
 
+from app.repositories.pool import LazyConnection
+
 class BaseRepository:
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: Union[Connection, LazyConnection]) -> None:
         self._conn = conn
 
     @property
-    def connection(self) -> Connection:
+    def connection(self) -> Union[Connection, LazyConnection]:
         return self._conn
+
+    def unit_of_work(self) -> AsyncContextManager[Any]:
+        # statements inside share one checkout, a plain connection already is one
+        if isinstance(self._conn, LazyConnection):
+            return self._conn.unit_of_work()
+
+        return nullcontext(self._conn)
+
+    @property
+    def last_read_from_replica(self) -> bool:
+        return isinstance(self._conn, LazyConnection) and self._conn.last_read_from_replica
+
+    def read_only(self) -> AsyncContextManager[Any]:
+        # like unit_of_work, but a healthy replica may serve the statements inside
+        if isinstance(self._conn, LazyConnection):
+            return self._conn.read_only()
+
+        return nullcontext(self._conn)
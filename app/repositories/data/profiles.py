@@ -1,9 +1,9 @@
-from typing import Optional, Union
+from typing import Dict, Iterable, Optional, Tuple, Union
 from asyncpg import Connection
 
+from app.repositories.errors import EntityDoesNotExist
 from app.repositories.queries.queries import queries
 from app.repositories.data.base import BaseRepository
-from app.repositories.data.authentication import AuthenticationRepository
 from app.models.domain.profiles import Profile
 from app.models.domain.users import User
 
@@ -12,7 +12,8 @@ UserLike = Union[User, Profile]
 class ProfilesRepository(BaseRepository):
     def __init__(self, conn: Connection):
         super().__init__(conn)
-        self._authentication_repository = AuthenticationRepository(conn)
+        # repositories live for a single request, so this memo never outlives the caller
+        self._profiles_cache: Dict[Tuple[Optional[str], str], Profile] = {}
 
     async def get_profile_by_username(
         self,
@@ -20,17 +21,44 @@ class ProfilesRepository(BaseRepository):
         username: str,
         requested_user: Optional[UserLike],
     ) -> Profile:
-        user = await self._authentication_repository.get_user_by_username(username=username)
+        profiles = await self.get_profiles_by_usernames(
+            usernames=[username],
+            requested_user=requested_user,
+        )
+        if username in profiles:
+            return profiles[username]
 
-        profile = Profile(username=user.username, bio=user.bio, image=user.image)
-        if requested_user:
-            profile.following = await self.is_user_following_for_another_user(
-                target_user=user,
-                requested_user=requested_user,
+        raise EntityDoesNotExist("user with username {0} does not exist".format(username))
+
+    async def get_profiles_by_usernames(
+        self,
+        *,
+        usernames: Iterable[str],
+        requested_user: Optional[UserLike],
+    ) -> Dict[str, Profile]:
+        follower_username = requested_user.username if requested_user else None
+        usernames = set(usernames)
+
+        missing_usernames = [
+            username
+            for username in usernames
+            if (follower_username, username) not in self._profiles_cache
+        ]
+        if missing_usernames:
+            profiles_rows = await queries.get_profiles_by_usernames(
+                self.connection,
+                usernames=missing_usernames,
+                follower_username=follower_username,
             )
+            for profile_row in profiles_rows:
+                self._profiles_cache[(follower_username, profile_row["username"])] = Profile(**profile_row)
+
+        return {
+            username: self._profiles_cache[(follower_username, username)]
+            for username in usernames
+            if (follower_username, username) in self._profiles_cache
+        }
 
-        return profile
-    
     async def is_user_following_for_another_user(
         self,
         *,
@@ -43,4 +71,4 @@ class ProfilesRepository(BaseRepository):
                 follower_username=requested_user.username,
                 following_username=target_user.username,
             )
-        )["is_following"]
\ No newline at end of file
+        )["is_following"]
@@ -0,0 +1,32 @@
+from app.repositories.cache import get_roles_cache
+from app.repositories.errors import EntityDoesNotExist
+from app.repositories.queries.queries import queries
+from app.repositories.data.base import BaseRepository
+
+CREATE_ROLE_ATTEMPTS = 3
+
+class RolesRepository(BaseRepository):
+    async def load_roles(self) -> None:
+        roles_rows = await queries.get_roles(self.connection)
+        get_roles_cache().load({role_row["name"]: role_row["id"] for role_row in roles_rows})
+
+    async def get_role_id(self, *, name: int) -> int:
+        roles_cache = get_roles_cache()
+        if not roles_cache.loaded:
+            await self.load_roles()
+
+        role_id = roles_cache.get_role_id(name)
+        if role_id is None:
+            role_id = await self._create_role(name=name)
+            roles_cache.set_role_id(name, role_id)
+
+        return role_id
+
+    async def _create_role(self, *, name: int) -> int:
+        # a role committed by a concurrent insert is only visible to the next statement
+        for _ in range(CREATE_ROLE_ATTEMPTS):
+            role_id = await queries.create_new_role(self.connection, name=name)
+            if role_id is not None:
+                return role_id
+
+        raise EntityDoesNotExist("role {0} could not be created or found".format(name))
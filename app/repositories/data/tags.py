@@ -0,0 +1,12 @@
+from typing import Sequence
+
+from app.repositories.queries.queries import queries
+from app.repositories.data.base import BaseRepository
+
+class TagsRepository(BaseRepository):
+    async def create_tags_and_link_to_article(self, *, article_id: int, tags: Sequence[str]) -> None:
+        await queries.create_tags_and_link_to_article(
+            self.connection,
+            article_id=article_id,
+            tags=list(tags),
+        )
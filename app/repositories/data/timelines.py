@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Optional
+
+from asyncpg import Connection, Record
+
+from app.core.config import get_app_settings
+from app.repositories.queries.queries import queries
+from app.repositories.data.base import BaseRepository
+from app.models.domain.users import User
+from app.toolkit.cursor import Keyset
+
+class TimelinesRepository(BaseRepository):
+    def __init__(self, conn: Connection) -> None:
+        super().__init__(conn)
+        settings = get_app_settings()
+        self._max_length = settings.timeline_max_length
+        self._fanout_max_followers = settings.timeline_fanout_max_followers
+
+    async def fan_out_article(self, *, article_id: int, created_at: datetime) -> None:
+        await queries.fan_out_article_to_timelines(
+            self.connection,
+            article_id=article_id,
+            created_at=created_at,
+            max_length=self._max_length,
+            fanout_max_followers=self._fanout_max_followers,
+        )
+
+    async def fan_out_imported_articles(self) -> None:
+        # runs in the import transaction, which recorded its articles in articles_imported
+        await queries.fan_out_imported_articles_to_timelines(
+            self.connection,
+            fanout_max_followers=self._fanout_max_followers,
+        )
+        await queries.trim_timelines_after_import(
+            self.connection,
+            max_length=self._max_length,
+        )
+
+    async def get_timeline_rows(
+        self,
+        *,
+        requested_user: User,
+        limit: int,
+        offset: int = 0,
+        after: Optional[Keyset] = None,
+    ) -> List[Record]:
+        if after:
+            after_created_at, after_id = after
+            return await queries.get_articles_for_timeline_after(
+                self.connection,
+                requested_username=requested_user.username,
+                fanout_max_followers=self._fanout_max_followers,
+                after_created_at=after_created_at,
+                after_id=after_id,
+                limit=limit,
+            )
+
+        return await queries.get_articles_for_timeline(
+            self.connection,
+            requested_username=requested_user.username,
+            fanout_max_followers=self._fanout_max_followers,
+            limit=limit,
+            offset=offset,
+        )
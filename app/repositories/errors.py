@@ -1,2 +1,16 @@
 class EntityDoesNotExist(Exception):
     """Raised when entity was not found in database."""
+
+class ConnectionAcquireTimeout(Exception):
+    """Raised when no pooled connection became free within the acquire timeout."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__("no database connection became free within {0} seconds".format(timeout))
+        self.timeout = timeout
+
+class EntityAlreadyExists(Exception):
+    """Raised when entity conflicts with a unique constraint in database."""
+
+    def __init__(self, field: str) -> None:
+        super().__init__("entity with this {0} already exists".format(field))
+        self.field = field
@@ -1,23 +1,99 @@
+import asyncio
+from typing import Any
+
 import asyncpg
 from fastapi import FastAPI
 from loguru import logger
 
 from app.core.settings.app import AppSettings
+from app.repositories.cache import ARTICLE_CHANGES_CHANNEL, handle_change, set_caches_enabled
+from app.repositories.data.roles import RolesRepository
+from app.repositories.pool import Replica, create_pool, create_replica
+from app.repositories.warmup import StatementsWarmup, get_statements_to_prepare
 
 async def connect_to_db(app: FastAPI, settings: AppSettings) -> None:
     logger.info("Connecting to PostgreSQL")
 
-    app.state.pool = await asyncpg.create_pool(
-        str(settings.database_url),
-        min_size=settings.min_connection_count,
-        max_size=settings.max_connection_count,
-    )
+    # every pooled connection prepares each statement once, right after it connects
+    warmup = StatementsWarmup(articles_json_from_db=settings.articles_json_from_db)
+    init = warmup if settings.prepare_statements else None
+    app.state.pool = await create_pool(settings, init=init)
+    app.state.replica = await create_replica(settings, init=init)
 
     logger.info("Connection established")
+    if init is not None:
+        logger.info(
+            "Prepared {0} statements on {1} connections",
+            len(get_statements_to_prepare(articles_json_from_db=settings.articles_json_from_db)),
+            app.state.pool.get_stats()["size"],
+        )
+
+    # signups reference roles by id and never have to write to the roles table
+    async with app.state.pool.acquire() as connection:
+        await RolesRepository(connection).load_roles()
 
 async def close_db_connection(app: FastAPI) -> None:
     logger.info("Closing connection to database")
 
     await app.state.pool.close()
+    if app.state.replica is not None:
+        await app.state.replica.pool.close()
 
     logger.info("Connection closed")
+
+def _on_article_change(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+    handle_change(payload)
+
+async def _listen_for_article_changes(app: FastAPI, settings: AppSettings) -> None:
+    while True:
+        try:
+            connection = await asyncpg.connect(
+                str(settings.database_url),
+                statement_cache_size=settings.database_statement_cache_size,
+            )
+            await connection.add_listener(ARTICLE_CHANGES_CHANNEL, _on_article_change)
+        except (OSError, asyncpg.PostgresError) as listen_error:
+            logger.warning("Unable to listen for article changes: {0}", listen_error)
+            await asyncio.sleep(settings.articles_cache_listener_retry_interval)
+            continue
+
+        set_caches_enabled(True)
+        app.state.articles_listener = connection
+        logger.info("Listening for article changes")
+
+        terminated = asyncio.Event()
+        connection.add_termination_listener(lambda _connection: terminated.set())
+        await terminated.wait()
+
+        app.state.articles_listener = None
+        set_caches_enabled(False)
+        logger.warning("Lost the article changes listener, caching is paused")
+
+async def start_articles_cache_listener(app: FastAPI, settings: AppSettings) -> None:
+    app.state.articles_listener = None
+    app.state.articles_listener_task = asyncio.create_task(
+        _listen_for_article_changes(app, settings),
+    )
+
+async def stop_articles_cache_listener(app: FastAPI) -> None:
+    app.state.articles_listener_task.cancel()
+    set_caches_enabled(False)
+
+    if app.state.articles_listener is not None:
+        await app.state.articles_listener.close()
+
+async def _monitor_replica(replica: Replica, settings: AppSettings) -> None:
+    while True:
+        await replica.check()
+        await asyncio.sleep(settings.replica_check_interval)
+
+async def start_replica_monitor(app: FastAPI, settings: AppSettings) -> None:
+    app.state.replica_monitor_task = None
+    if app.state.replica is not None:
+        app.state.replica_monitor_task = asyncio.create_task(
+            _monitor_replica(app.state.replica, settings),
+        )
+
+async def stop_replica_monitor(app: FastAPI) -> None:
+    if app.state.replica_monitor_task is not None:
+        app.state.replica_monitor_task.cancel()
@@ -0,0 +1,32 @@
+"""add articles search vector
+
+Revision ID: 0a7c5e4d1f38
+Revises: f2d86b3e9a15
+Create Date: 2026-10-18 15:48:12.336470
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+revision = '0a7c5e4d1f38'
+down_revision = 'f2d86b3e9a15'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english', title), 'A')
+    || setweight(to_tsvector('english', description), 'B')
+    || setweight(to_tsvector('english', body), 'C')
+"""
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column("search_vector", pg.TSVECTOR, sa.Computed(SEARCH_VECTOR, persisted=True), nullable=False),
+    )
+    op.create_index("ix_articles_search_vector", "articles", ["search_vector"], postgresql_using="gin")
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_search_vector", table_name="articles")
+    op.drop_column("articles", "search_vector")
@@ -0,0 +1,61 @@
+"""add article change notifications
+
+Revision ID: 3d5f0b8e6a27
+Revises: 7b19e2c05d64
+Create Date: 2026-10-18 17:52:36.904127
+
+"""
+from alembic import op
+
+revision = '3d5f0b8e6a27'
+down_revision = '7b19e2c05d64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # payloads are read by app.repositories.cache.ArticlesCache.handle_change
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_article_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('article_changes', 'slug:' || OLD.slug);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER notify_article_changed
+        AFTER UPDATE OR DELETE ON articles
+        FOR EACH ROW EXECUTE PROCEDURE notify_article_changed();
+        """
+    )
+    # cached articles embed their author's profile and follower state
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_author_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('article_changes', 'author:' || OLD.username);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER notify_author_changed
+        AFTER UPDATE OF username, bio, image, followers_count ON users
+        FOR EACH ROW EXECUTE PROCEDURE notify_author_changed();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS notify_author_changed ON users")
+    op.execute("DROP FUNCTION IF EXISTS notify_author_changed")
+    op.execute("DROP TRIGGER IF EXISTS notify_article_changed ON articles")
+    op.execute("DROP FUNCTION IF EXISTS notify_article_changed")
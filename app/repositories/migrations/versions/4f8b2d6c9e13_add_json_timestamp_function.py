@@ -0,0 +1,36 @@
+"""add json timestamp function
+
+Revision ID: 4f8b2d6c9e13
+Revises: e5a1c93f7b42
+Create Date: 2026-10-18 19:42:10.584216
+
+"""
+from alembic import op
+
+revision = '4f8b2d6c9e13'
+down_revision = 'e5a1c93f7b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # the text orjson writes for a UTC datetime, so JSON rendered by queries
+    # matches the one rendered from models
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION json_timestamp(value TIMESTAMPTZ)
+        RETURNS TEXT AS $$
+            SELECT TO_CHAR(
+                value AT TIME ZONE 'UTC',
+                CASE
+                    WHEN DATE_TRUNC('second', value) = value THEN 'YYYY-MM-DD"T"HH24:MI:SS"Z"'
+                    ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+                END
+            );
+        $$ LANGUAGE sql STABLE;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS json_timestamp")
@@ -0,0 +1,22 @@
+"""add articles keyset index
+
+Revision ID: 5b0e7d2c4a91
+Revises: d995911f8c6e
+Create Date: 2026-10-18 09:12:41.518304
+
+"""
+from alembic import op
+
+revision = '5b0e7d2c4a91'
+down_revision = 'd995911f8c6e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # backs the (created_at, id) ordering and cursor predicate of the article lists
+    op.create_index("ix_articles_created_at_id", "articles", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_created_at_id", table_name="articles")
@@ -0,0 +1,22 @@
+"""add articles updated_at index
+
+Revision ID: 7b19e2c05d64
+Revises: 0a7c5e4d1f38
+Create Date: 2026-10-18 17:24:09.310572
+
+"""
+from alembic import op
+
+revision = '7b19e2c05d64'
+down_revision = '0a7c5e4d1f38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # backs the (updated_at, id) ordering and updated_since range of the article export
+    op.create_index("ix_articles_updated_at_id", "articles", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_updated_at_id", table_name="articles")
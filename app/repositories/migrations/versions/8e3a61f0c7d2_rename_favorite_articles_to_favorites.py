@@ -0,0 +1,24 @@
+"""rename favorite_articles to favorites
+
+Revision ID: 8e3a61f0c7d2
+Revises: 5b0e7d2c4a91
+Create Date: 2026-10-18 11:37:05.204519
+
+"""
+from alembic import op
+
+revision = '8e3a61f0c7d2'
+down_revision = '5b0e7d2c4a91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # every query addresses article favorites as "favorites"
+    op.rename_table("favorite_articles", "favorites")
+    op.execute("ALTER TABLE favorites RENAME CONSTRAINT pk_favorite_articles TO pk_favorites")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE favorites RENAME CONSTRAINT pk_favorites TO pk_favorite_articles")
+    op.rename_table("favorites", "favorite_articles")
@@ -0,0 +1,36 @@
+"""notify user deletions
+
+Revision ID: 9c2e7a4b1d60
+Revises: 3d5f0b8e6a27
+Create Date: 2026-10-18 18:31:05.622814
+
+"""
+from alembic import op
+
+revision = '9c2e7a4b1d60'
+down_revision = '3d5f0b8e6a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # cached principals must also be dropped when their user is deleted
+    op.execute("DROP TRIGGER notify_author_changed ON users")
+    op.execute(
+        """
+        CREATE TRIGGER notify_author_changed
+        AFTER UPDATE OF username, bio, image, followers_count OR DELETE ON users
+        FOR EACH ROW EXECUTE PROCEDURE notify_author_changed();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER notify_author_changed ON users")
+    op.execute(
+        """
+        CREATE TRIGGER notify_author_changed
+        AFTER UPDATE OF username, bio, image, followers_count ON users
+        FOR EACH ROW EXECUTE PROCEDURE notify_author_changed();
+        """
+    )
@@ -0,0 +1,83 @@
+"""add article counters
+
+Revision ID: c41f9d8a2b6e
+Revises: 8e3a61f0c7d2
+Create Date: 2026-10-18 13:02:19.770214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c41f9d8a2b6e'
+down_revision = '8e3a61f0c7d2'
+branch_labels = None
+depends_on = None
+
+def create_counter_trigger(*, table: str, column: str) -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION update_article_{column}()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE articles SET {column} = {column} + 1 WHERE id = NEW.article_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE articles SET {column} = {column} - 1 WHERE id = OLD.article_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER update_article_{column}
+        AFTER INSERT OR DELETE ON {table}
+        FOR EACH ROW EXECUTE PROCEDURE update_article_{column}();
+        """
+    )
+
+def drop_counter_trigger(*, table: str, column: str) -> None:
+    op.execute(f"DROP TRIGGER IF EXISTS update_article_{column} ON {table}")
+    op.execute(f"DROP FUNCTION IF EXISTS update_article_{column}")
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("favorites_count", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("articles", sa.Column("reviews_count", sa.Integer, nullable=False, server_default="0"))
+
+    # counter writes must not look like content edits to updated_at
+    op.execute("DROP TRIGGER update_article_modtime ON articles")
+    op.execute(
+        """
+        CREATE TRIGGER update_article_modtime
+        BEFORE UPDATE OF slug, title, description, body, image, author_id ON articles
+        FOR EACH ROW EXECUTE PROCEDURE update_updated_at_column();
+        """
+    )
+
+    create_counter_trigger(table="favorites", column="favorites_count")
+    create_counter_trigger(table="reviews", column="reviews_count")
+
+    op.execute(
+        """
+        UPDATE articles a
+        SET favorites_count = (SELECT count(*) FROM favorites f WHERE f.article_id = a.id),
+            reviews_count   = (SELECT count(*) FROM reviews r WHERE r.article_id = a.id);
+        """
+    )
+
+def downgrade() -> None:
+    drop_counter_trigger(table="reviews", column="reviews_count")
+    drop_counter_trigger(table="favorites", column="favorites_count")
+
+    op.execute("DROP TRIGGER update_article_modtime ON articles")
+    op.execute(
+        """
+        CREATE TRIGGER update_article_modtime
+        BEFORE UPDATE ON articles
+        FOR EACH ROW EXECUTE PROCEDURE update_updated_at_column();
+        """
+    )
+
+    op.drop_column("articles", "reviews_count")
+    op.drop_column("articles", "favorites_count")
@@ -0,0 +1,40 @@
+"""notify role changes
+
+Revision ID: e5a1c93f7b42
+Revises: 9c2e7a4b1d60
+Create Date: 2026-10-18 18:58:44.107392
+
+"""
+from alembic import op
+
+revision = 'e5a1c93f7b42'
+down_revision = '9c2e7a4b1d60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # workers reload their roles cache whole, one notification per statement is enough
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_roles_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('article_changes', 'roles');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER notify_roles_changed
+        AFTER INSERT OR UPDATE OR DELETE ON roles
+        FOR EACH STATEMENT EXECUTE PROCEDURE notify_roles_changed();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS notify_roles_changed ON roles")
+    op.execute("DROP FUNCTION IF EXISTS notify_roles_changed")
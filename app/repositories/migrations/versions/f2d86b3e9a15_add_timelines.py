@@ -0,0 +1,98 @@
+"""add timelines
+
+Revision ID: f2d86b3e9a15
+Revises: c41f9d8a2b6e
+Create Date: 2026-10-18 14:26:53.081947
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import get_app_settings
+
+revision = 'f2d86b3e9a15'
+down_revision = 'c41f9d8a2b6e'
+branch_labels = None
+depends_on = None
+
+def create_followers_count() -> None:
+    op.add_column("users", sa.Column("followers_count", sa.Integer, nullable=False, server_default="0"))
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_user_followers_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE users SET followers_count = followers_count + 1 WHERE id = NEW.following_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE users SET followers_count = followers_count - 1 WHERE id = OLD.following_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER update_user_followers_count
+        AFTER INSERT OR DELETE ON followers_to_followings
+        FOR EACH ROW EXECUTE PROCEDURE update_user_followers_count();
+        """
+    )
+    op.execute(
+        """
+        UPDATE users u
+        SET followers_count = (SELECT count(*) FROM followers_to_followings f WHERE f.following_id = u.id);
+        """
+    )
+
+def create_timelines_table() -> None:
+    op.create_table(
+        "timelines",
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("article_id", sa.Integer, sa.ForeignKey("articles.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+    )
+    op.create_primary_key("pk_timelines", "timelines", ["user_id", "article_id"])
+    op.create_index("ix_timelines_user_id_created_at_article_id", "timelines", ["user_id", "created_at", "article_id"])
+
+def backfill_timelines() -> None:
+    # without it every feed stays empty until the followed authors post again,
+    # authors above the fan-out limit are merged in at read time and skipped here
+    settings = get_app_settings()
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO timelines (user_id, article_id, created_at)
+            SELECT follower.id, newest.id, newest.created_at
+            FROM users follower,
+                 LATERAL (
+                     SELECT a.id, a.created_at
+                     FROM followers_to_followings f
+                              INNER JOIN users u ON
+                             u.id = f.following_id
+                              INNER JOIN articles a ON
+                             a.author_id = u.id
+                     WHERE f.follower_id = follower.id
+                       AND u.followers_count <= :fanout_max_followers
+                     ORDER BY a.created_at DESC, a.id DESC
+                     LIMIT :max_length
+                     ) newest;
+            """
+        ).bindparams(
+            fanout_max_followers=settings.timeline_fanout_max_followers,
+            max_length=settings.timeline_max_length,
+        )
+    )
+
+def upgrade() -> None:
+    create_followers_count()
+    create_timelines_table()
+    backfill_timelines()
+
+def downgrade() -> None:
+    op.drop_table("timelines")
+
+    op.execute("DROP TRIGGER IF EXISTS update_user_followers_count ON followers_to_followings")
+    op.execute("DROP FUNCTION IF EXISTS update_user_followers_count")
+    op.drop_column("users", "followers_count")
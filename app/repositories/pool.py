@@ -0,0 +1,312 @@
+import asyncio
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import asyncpg
+from asyncpg import Record
+from asyncpg.pool import Pool
+
+from loguru import logger
+
+from app.core.settings.app import AppSettings
+from app.repositories.errors import ConnectionAcquireTimeout
+
+ACQUIRE_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# seconds behind the primary, a replica that replayed everything it received is not behind
+# however long ago the last write was, and a primary standing in as a replica never is.
+# Having replayed everything says nothing while the WAL receiver is not streaming, such a
+# replica has no lag (NULL) and is left alone. The status column is only visible to roles
+# with pg_read_all_stats (e.g. pg_monitor), grant it to the user REPLICA_DATABASE_URL uses.
+REPLICA_LAG_QUERY = """
+SELECT CASE
+           WHEN NOT pg_is_in_recovery() THEN 0
+           WHEN NOT EXISTS(SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+           WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+           ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+       END::FLOAT
+"""
+
+class PoolConnection(asyncpg.Connection):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.connected_at = time.monotonic()
+
+class LatencyHistogram:
+    def __init__(self, buckets: Sequence[float] = ACQUIRE_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        # one slot per bucket plus the overflow above the last one
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        # cumulative, each bucket counts every observation at or below its bound
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets["le_{0}".format(bound)] = cumulative
+        buckets["le_inf"] = cumulative + self.counts[-1]
+
+        return {
+            "buckets": buckets,
+            "count": buckets["le_inf"],
+            "sum_ms": round(self.total * 1000, 3),
+        }
+
+class InstrumentedPool:
+    def __init__(self, pool: Pool, *, acquire_timeout: float, max_connection_age: float) -> None:
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+        self._max_connection_age = max_connection_age
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.acquire_timeouts = 0
+        self.recycled = 0
+        self.acquire_latency = LatencyHistogram()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        connection = await self.checkout()
+        try:
+            yield connection
+        finally:
+            await self.checkin(connection)
+
+    async def checkout(self) -> asyncpg.Connection:
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            connection = await self._pool.acquire(timeout=self._acquire_timeout)
+        except asyncio.TimeoutError:
+            self.acquire_timeouts += 1
+            raise ConnectionAcquireTimeout(self._acquire_timeout)
+        finally:
+            self.waiting -= 1
+
+        self.acquire_latency.observe(time.monotonic() - started)
+        self.acquired += 1
+        self.in_use += 1
+        return connection
+
+    async def checkin(self, connection: asyncpg.Connection) -> None:
+        self.in_use -= 1
+        await self._release(connection)
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": self._pool.get_size(),
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+            "in_use": self.in_use,
+            "idle": self._pool.get_idle_size(),
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "acquire_timeouts": self.acquire_timeouts,
+            "recycled": self.recycled,
+            "acquire_latency": self.acquire_latency.get_stats(),
+        }
+
+    async def _release(self, connection: asyncpg.Connection) -> None:
+        if time.monotonic() - connection.connected_at < self._max_connection_age:
+            await self._pool.release(connection)
+            return
+
+        # closing hands the slot back to the pool, it reconnects on the next acquire
+        self.recycled += 1
+        await connection.close()
+
+class Replica:
+    def __init__(self, pool: InstrumentedPool, *, max_lag: float) -> None:
+        self.pool = pool
+        self.max_lag = max_lag
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self._checked = False
+
+    async def check(self) -> None:
+        was_healthy = self.healthy
+        try:
+            async with self.pool.acquire() as connection:
+                self.lag = await connection.fetchval(REPLICA_LAG_QUERY)
+        except (OSError, asyncpg.PostgresError, ConnectionAcquireTimeout) as check_error:
+            self.lag = None
+            check_failure = check_error
+        else:
+            check_failure = "not streaming from the primary" if self.lag is None else None
+
+        self.healthy = self.lag is not None and self.lag <= self.max_lag
+        # only changes are logged, a replica that stays down would flood the log
+        if self.healthy and not was_healthy:
+            logger.info("Replica is available, lag {0}s", self.lag)
+        elif not self.healthy and (was_healthy or not self._checked):
+            logger.warning("Replica is unavailable, reads go to the primary: {0}", check_failure or "lag {0}s".format(self.lag))
+        self._checked = True
+
+    def mark_unhealthy(self) -> None:
+        # the next check decides when reads may come back
+        self.healthy = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            **self.pool.get_stats(),
+        }
+
+class LazyConnection:
+    # stands in for a connection in repositories: every statement checks one out
+    # and returns it right away, unless a unit of work or transaction is holding one
+    def __init__(self, pool: InstrumentedPool, replica: Optional[Replica] = None) -> None:
+        self._pool = pool
+        self._replica = replica
+        self._held: Optional[asyncpg.Connection] = None
+        # once the primary served a statement, later reads see what it wrote
+        self._used_primary = False
+        self.last_read_from_replica = False
+
+    async def acquire(self) -> asyncpg.Connection:
+        # together with release, the pool protocol aiosql checks queries out with
+        if self._held is not None:
+            return self._held
+
+        self._used_primary = True
+        return await self._pool.checkout()
+
+    async def release(self, connection: asyncpg.Connection) -> None:
+        if connection is not self._held:
+            await self._pool.checkin(connection)
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[asyncpg.Connection]:
+        # nested units share the outer checkout
+        if self._held is not None:
+            yield self._held
+            return
+
+        self._used_primary = True
+        self._held = await self._pool.checkout()
+        try:
+            yield self._held
+        finally:
+            connection, self._held = self._held, None
+            await self._pool.checkin(connection)
+
+    @asynccontextmanager
+    async def read_only(self) -> AsyncIterator[asyncpg.Connection]:
+        # a unit of work that the replica may serve, everything else stays on the primary
+        replica_connection = await self._checkout_replica()
+        self.last_read_from_replica = replica_connection is not None
+        if replica_connection is None:
+            async with self.unit_of_work() as connection:
+                yield connection
+            return
+
+        self._held = replica_connection
+        try:
+            yield replica_connection
+        finally:
+            self._held = None
+            await self._replica.pool.checkin(replica_connection)
+
+    @asynccontextmanager
+    async def transaction(self, **kwargs: Any) -> AsyncIterator[asyncpg.Connection]:
+        async with self.unit_of_work() as connection:
+            async with connection.transaction(**kwargs):
+                yield connection
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> List[Record]:
+        async with self._checked_out() as connection:
+            return await connection.fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Optional[Record]:
+        async with self._checked_out() as connection:
+            return await connection.fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        async with self._checked_out() as connection:
+            return await connection.fetchval(query, *args, **kwargs)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        async with self._checked_out() as connection:
+            return await connection.execute(query, *args, **kwargs)
+
+    async def copy_records_to_table(self, table_name: str, **kwargs: Any) -> str:
+        async with self._checked_out() as connection:
+            return await connection.copy_records_to_table(table_name, **kwargs)
+
+    async def _checkout_replica(self) -> Optional[asyncpg.Connection]:
+        if self._held is not None or self._used_primary:
+            return None
+
+        if self._replica is None or not self._replica.healthy:
+            return None
+
+        try:
+            return await self._replica.pool.checkout()
+        except (OSError, asyncpg.PostgresError, ConnectionAcquireTimeout) as checkout_error:
+            logger.warning("Replica checkout failed, reads go to the primary: {0}", checkout_error)
+            self._replica.mark_unhealthy()
+            return None
+
+    @asynccontextmanager
+    async def _checked_out(self) -> AsyncIterator[asyncpg.Connection]:
+        connection = await self.acquire()
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+async def create_pool(
+    settings: AppSettings,
+    *,
+    dsn: Optional[str] = None,
+    min_size: Optional[int] = None,
+    init: Optional[Callable[[asyncpg.Connection], Awaitable[Any]]] = None,
+) -> InstrumentedPool:
+    # connections above min_size are opened on demand and closed again once
+    # they sit idle, asyncpg itself recycles them after max_queries
+    pool = await asyncpg.create_pool(
+        dsn or str(settings.database_url),
+        min_size=settings.min_connection_count if min_size is None else min_size,
+        max_size=settings.max_connection_count,
+        max_queries=settings.connection_max_queries,
+        max_inactive_connection_lifetime=settings.connection_max_idle_time,
+        statement_cache_size=settings.database_statement_cache_size,
+        connection_class=PoolConnection,
+        init=init,
+    )
+
+    return InstrumentedPool(
+        pool,
+        acquire_timeout=settings.connection_acquire_timeout,
+        max_connection_age=settings.connection_max_age,
+    )
+
+async def create_replica(
+    settings: AppSettings,
+    *,
+    init: Optional[Callable[[asyncpg.Connection], Awaitable[Any]]] = None,
+) -> Optional[Replica]:
+    if not settings.replica_database_url:
+        return None
+
+    # nothing is opened up front, a replica that is down at startup only costs its reads
+    replica_pool = await create_pool(
+        settings,
+        dsn=str(settings.replica_database_url),
+        min_size=0,
+        init=init,
+    )
+    return Replica(replica_pool, max_lag=settings.replica_max_lag)
@@ -1,22 +1,28 @@
 """Typings for queries generated by aiosql"""
 
-from typing import Optional
+from datetime import datetime
+from typing import AsyncContextManager, List, Optional, Sequence
 
 from asyncpg import Connection, Record
+from asyncpg.cursor import CursorFactory
 
 class UsersQueriesMixin:
     async def get_user_by_email(self, conn: Connection, *, email: str) -> Record: ...
     async def get_user_by_username(
         self, conn: Connection, *, username: str
     ) -> Record: ...
-    async def create_new_user(
+    async def get_principal_by_username(
+        self, conn: Connection, *, username: str
+    ) -> Record: ...
+    async def create_new_user_with_role(
         self,
         conn: Connection,
         *,
         username: str,
         email: str,
         salt: str,
-        hashed_password: str
+        hashed_password: str,
+        role_id: int
     ) -> Record: ...
     async def update_user_by_username(
         self,
@@ -30,31 +36,56 @@ class UsersQueriesMixin:
         new_bio: Optional[str],
         new_image: Optional[str]
     ) -> Record: ...
+    async def update_user_hashed_password(
+        self, conn: Connection, *, id: int, hashed_password: str
+    ) -> None: ...
+    async def get_roles(self, conn: Connection) -> List[Record]: ...
     async def create_new_role(
         self,
         conn: Connection,
         *,
         name: int
-    ) -> int: ...
-    async def create_new_user_to_role(
-        self,
-        conn: Connection,
-        *,
-        user_id: int,
-        role_id: int
-    ) -> None: ...
+    ) -> Optional[int]: ...
 
 class ProfilesQueriesMixin:
     async def is_user_following_for_another(
         self, conn: Connection, *, follower_username: str, following_username: str
     ) -> Record: ...
+    async def get_profiles_by_usernames(
+        self,
+        conn: Connection,
+        *,
+        usernames: Sequence[str],
+        follower_username: Optional[str]
+    ) -> List[Record]: ...
 
 class ArticlesQueriesMixin:
     async def get_articles_for_feed(
-        self, conn: Connection, *, follower_username: str, limit: int, offset: int
-    ) -> Record: ...
+        self,
+        conn: Connection,
+        *,
+        requested_username: Optional[str],
+        exact_count: bool,
+        limit: int,
+        offset: int
+    ) -> List[Record]: ...
+    async def get_articles_for_feed_after(
+        self,
+        conn: Connection,
+        *,
+        requested_username: Optional[str],
+        after_created_at: datetime,
+        after_id: int,
+        limit: int
+    ) -> List[Record]: ...
     async def get_article_by_slug(
-        self, conn: Connection, *, slug: str
+        self, conn: Connection, *, slug: str, requested_username: Optional[str]
+    ) -> Record: ...
+    async def get_article_json_by_slug(
+        self, conn: Connection, *, slug: str, requested_username: Optional[str]
+    ) -> Record: ...
+    async def get_article_validators_by_slug(
+        self, conn: Connection, *, slug: str, requested_username: Optional[str]
     ) -> Record: ...
     async def create_new_article(
         self,
@@ -63,8 +94,10 @@ class ArticlesQueriesMixin:
         slug: str,
         title: str,
         description: str,
+        image: str,
         body: str,
-        author_username: str
+        author_username: str,
+        tags: Sequence[str]
     ) -> Record: ...
     async def update_article(
         self,
@@ -81,11 +114,77 @@ class ArticlesQueriesMixin:
     async def delete_article(
         self, conn: Connection, *, slug: str, author_username: str
     ) -> None: ...
+    async def search_articles(
+        self,
+        conn: Connection,
+        *,
+        query: str,
+        limit: int,
+        offset: int,
+        requested_username: Optional[str]
+    ) -> List[Record]: ...
+    def get_articles_for_export_cursor(
+        self, conn: Connection, *, updated_since: Optional[datetime]
+    ) -> AsyncContextManager[CursorFactory]: ...
+    async def lock_articles_batch_for_reconcile(
+        self, conn: Connection, *, after_id: int, batch_size: int
+    ) -> List[Record]: ...
+    async def reconcile_article_counters(
+        self, conn: Connection, *, article_ids: Sequence[int]
+    ) -> Record: ...
+
+class TagsQueriesMixin:
+    async def create_tags_and_link_to_article(
+        self, conn: Connection, *, article_id: int, tags: Sequence[str]
+    ) -> None: ...
+
+class ImportsQueriesMixin:
+    async def create_articles_import_table(self, conn: Connection) -> None: ...
+    async def import_staged_articles(self, conn: Connection) -> List[Record]: ...
+
+class TimelinesQueriesMixin:
+    async def fan_out_article_to_timelines(
+        self,
+        conn: Connection,
+        *,
+        article_id: int,
+        created_at: datetime,
+        max_length: int,
+        fanout_max_followers: int
+    ) -> None: ...
+    async def fan_out_imported_articles_to_timelines(
+        self, conn: Connection, *, fanout_max_followers: int
+    ) -> None: ...
+    async def trim_timelines_after_import(
+        self, conn: Connection, *, max_length: int
+    ) -> None: ...
+    async def get_articles_for_timeline(
+        self,
+        conn: Connection,
+        *,
+        requested_username: str,
+        fanout_max_followers: int,
+        limit: int,
+        offset: int
+    ) -> List[Record]: ...
+    async def get_articles_for_timeline_after(
+        self,
+        conn: Connection,
+        *,
+        requested_username: str,
+        fanout_max_followers: int,
+        after_created_at: datetime,
+        after_id: int,
+        limit: int
+    ) -> List[Record]: ...
 
 class Queries(
     UsersQueriesMixin,
     ProfilesQueriesMixin,
     ArticlesQueriesMixin,
+    TagsQueriesMixin,
+    TimelinesQueriesMixin,
+    ImportsQueriesMixin,
 ): ...
 
 queries: Queries
\ No newline at end of file
@@ -20,9 +20,9 @@ WHERE user_id = (SELECT id FROM users WHERE username = :username)
 
 
 -- name: get-favorites-count-for-article^
-SELECT count(*) as favorites_count
-FROM favorites
-WHERE article_id = (SELECT id FROM articles WHERE slug = :slug);
+SELECT favorites_count
+FROM articles
+WHERE slug = :slug;
 
 
 -- name: get-tags-for-article-by-slug
@@ -35,17 +35,102 @@ FROM tags t
 
 
 -- name: get-article-by-slug^
-SELECT id,
-       slug,
-       title,
-       description,
-       body,
-       image,
-       created_at,
-       updated_at,
-       (SELECT username FROM users WHERE id = author_id) AS author_username
-FROM articles
-WHERE slug = :slug
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       a.created_at,
+       a.updated_at,
+       (SELECT username FROM users WHERE id = a.author_id) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS favorited
+FROM articles a
+WHERE a.slug = :slug
+LIMIT 1;
+
+
+-- name: get-article-json-by-slug^
+SELECT JSON_BUILD_OBJECT(
+           'createdAt', json_timestamp(a.created_at),
+           'updatedAt', json_timestamp(a.updated_at),
+           'id', a.id,
+           'slug', a.slug,
+           'title', a.title,
+           'description', a.description,
+           'body', a.body,
+           'image', a.image,
+           'tag_list', ARRAY(
+               SELECT att.tag
+               FROM articles_to_tags att
+               WHERE att.article_id = a.id
+               ORDER BY att.tag
+           ),
+           'author', (
+               SELECT JSON_BUILD_OBJECT(
+                          'username', u.username,
+                          'bio', u.bio,
+                          'image', u.image,
+                          'following', EXISTS(
+                              SELECT 1
+                              FROM followers_to_followings ftf
+                              WHERE ftf.following_id = u.id
+                                AND ftf.follower_id = (SELECT id FROM users WHERE username = :requested_username)
+                          )
+                      )
+               FROM users u
+               WHERE u.id = a.author_id
+           ),
+           'favorited', EXISTS(
+               SELECT 1
+               FROM favorites f
+               WHERE f.article_id = a.id
+                 AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+           ),
+           'favoritesCount', a.favorites_count,
+           'reviewsCount', a.reviews_count
+       ) AS article
+FROM articles a
+WHERE a.slug = :slug
+LIMIT 1;
+
+
+-- name: get-article-validators-by-slug^
+SELECT a.id,
+       a.slug,
+       u.username AS author_username,
+       GREATEST(a.updated_at, u.updated_at) AS updated_at,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS favorited,
+       EXISTS(
+           SELECT 1
+           FROM followers_to_followings ff
+           WHERE ff.following_id = u.id
+             AND ff.follower_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS following
+FROM articles a
+         INNER JOIN users u ON
+    u.id = a.author_id
+WHERE a.slug = :slug
 LIMIT 1;
 
 
@@ -66,17 +151,14 @@ RETURNING
     image,
     body,
         (SELECT username FROM author_subquery) as author_username,
+    CAST(:tags AS TEXT[]) AS tags,
+    favorites_count,
+    reviews_count,
+    FALSE AS favorited,
     created_at,
     updated_at;
 
 
--- name: add-tags-to-article*!
-INSERT INTO articles_to_tags (article_id, tag)
-VALUES ((SELECT id FROM articles WHERE slug = :slug),
-        (SELECT tag FROM tags WHERE tag = :tag))
-ON CONFLICT DO NOTHING;
-
-
 -- name: update-article<!
 UPDATE articles
 SET slug        = :new_slug,
@@ -109,12 +191,179 @@ SELECT a.id,
            SELECT username
            FROM users
            WHERE id = a.author_id
-       ) AS author_username
+       ) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS favorited,
+       CASE
+           WHEN :exact_count THEN (SELECT count(*) FROM articles)
+           -- planner statistics, cheap but only as fresh as the last ANALYZE
+           ELSE (SELECT GREATEST(reltuples, 0)::BIGINT FROM pg_class WHERE oid = 'articles'::REGCLASS)
+           END AS articles_count
 FROM articles a
-        --  INNER JOIN followers_to_followings f ON
-        -- f.following_id = a.author_id AND
-        -- f.follower_id = (SELECT id FROM users WHERE username = :follower_username)
-ORDER BY a.created_at
+ORDER BY a.created_at DESC, a.id DESC
 LIMIT :limit
 OFFSET
 :offset;
+
+
+-- name: get-articles-for-feed-after
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       a.created_at,
+       a.updated_at,
+       (
+           SELECT username
+           FROM users
+           WHERE id = a.author_id
+       ) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS favorited
+-- keyset pages carry no total, the first page reported it
+FROM articles a
+WHERE (a.created_at, a.id) < (:after_created_at, :after_id)
+ORDER BY a.created_at DESC, a.id DESC
+LIMIT :limit;
+
+
+-- name: lock-articles-batch-for-reconcile
+SELECT id
+FROM articles
+WHERE id > :after_id
+ORDER BY id
+LIMIT :batch_size
+FOR UPDATE;
+
+
+-- name: reconcile-article-counters^
+-- runs after lock-articles-batch-for-reconcile in the same transaction, the counter
+-- triggers of the batch wait for it, and this statement sees everything they committed
+WITH counted AS (
+    SELECT a.id,
+           (SELECT count(*) FROM favorites f WHERE f.article_id = a.id) AS favorites_count,
+           (SELECT count(*) FROM reviews r WHERE r.article_id = a.id)   AS reviews_count
+    FROM unnest(CAST(:article_ids AS INTEGER[])) AS a(id)
+),
+     reconciled AS (
+         UPDATE articles a
+             SET favorites_count = c.favorites_count,
+                 reviews_count = c.reviews_count
+             FROM counted c
+             WHERE a.id = c.id
+                 AND (a.favorites_count, a.reviews_count) IS DISTINCT FROM (c.favorites_count, c.reviews_count)
+             RETURNING a.id
+     )
+SELECT count(*) AS reconciled_count
+FROM reconciled;
+
+
+-- name: search-articles
+WITH search AS (
+    SELECT websearch_to_tsquery('english', :query) AS query
+),
+     ranked AS (
+         SELECT a.id,
+                ts_rank(a.search_vector, s.query) AS rank
+         FROM articles a,
+              search s
+         WHERE a.search_vector @@ s.query
+         ORDER BY rank DESC, a.id DESC
+         LIMIT :limit
+         OFFSET :offset
+     )
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       a.created_at,
+       a.updated_at,
+       (
+           SELECT username
+           FROM users
+           WHERE id = a.author_id
+       ) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM users WHERE username = :requested_username)
+       ) AS favorited,
+       r.rank,
+       -- highlighting only runs for the rows of the requested page, the text is
+       -- HTML-escaped first so <mark> is the only markup a snippet can carry
+       ts_headline(
+           'english',
+           replace(replace(replace(replace(replace(
+               a.description || ' ' || a.body,
+               '&', '&amp;'), '<', '&lt;'), '>', '&gt;'), '"', '&quot;'), '''', '&#39;'),
+           s.query,
+           'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10'
+       ) AS snippet
+FROM ranked r
+         INNER JOIN articles a ON
+    a.id = r.id,
+     search s
+ORDER BY r.rank DESC, a.id DESC;
+
+
+-- name: get-articles-for-export
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       u.username AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       a.created_at,
+       a.updated_at
+FROM articles a
+         -- articles of deleted authors keep a NULL author_id and are exported too
+         LEFT OUTER JOIN users u ON
+    u.id = a.author_id
+WHERE a.updated_at > COALESCE(:updated_since, '-infinity'::TIMESTAMPTZ)
+ORDER BY a.updated_at, a.id;
@@ -0,0 +1,84 @@
+-- name: create-articles-import-table#
+CREATE TEMPORARY TABLE articles_import
+(
+    line_number     INTEGER NOT NULL,
+    slug            TEXT    NOT NULL,
+    title           TEXT    NOT NULL,
+    description     TEXT    NOT NULL,
+    body            TEXT    NOT NULL,
+    image           TEXT    NOT NULL,
+    author_username TEXT    NOT NULL,
+    tags            TEXT[]  NOT NULL,
+    created_at      TIMESTAMPTZ
+) ON COMMIT DROP;
+
+CREATE TEMPORARY TABLE articles_imported
+(
+    id         INTEGER     NOT NULL,
+    author_id  INTEGER     NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL
+) ON COMMIT DROP;
+
+
+-- name: import-staged-articles
+WITH candidates AS (
+    SELECT DISTINCT ON (i.slug) i.line_number,
+                                i.slug,
+                                i.title,
+                                i.description,
+                                i.body,
+                                i.image,
+                                i.tags,
+                                coalesce(i.created_at, now()) AS created_at,
+                                u.id                          AS author_id
+    FROM articles_import i
+             INNER JOIN users u ON
+        u.username = i.author_username
+    ORDER BY i.slug, i.line_number
+),
+     inserted AS (
+         INSERT INTO articles (slug, title, description, body, image, author_id, created_at, updated_at)
+             SELECT slug, title, description, body, image, author_id, created_at, created_at
+             FROM candidates
+             ON CONFLICT (slug) DO NOTHING
+             RETURNING id, slug, author_id, created_at
+     ),
+     recorded AS (
+         -- read back by the timeline fan-out later in the same transaction
+         INSERT INTO articles_imported (id, author_id, created_at)
+             SELECT id, author_id, created_at
+             FROM inserted
+     ),
+     created_tags AS (
+         INSERT INTO tags (tag)
+             SELECT DISTINCT unnest(c.tags)
+             FROM candidates c
+                      INNER JOIN inserted ins ON
+                 ins.slug = c.slug
+             ON CONFLICT DO NOTHING
+     ),
+     linked_tags AS (
+         INSERT INTO articles_to_tags (article_id, tag)
+             SELECT DISTINCT ins.id, unnest(c.tags)
+             FROM inserted ins
+                      INNER JOIN candidates c ON
+                 c.slug = ins.slug
+             ON CONFLICT DO NOTHING
+     )
+SELECT i.line_number,
+       i.slug,
+       CASE
+           WHEN u.id IS NULL THEN 'author_does_not_exist'
+           WHEN c.line_number <> i.line_number THEN 'duplicated_in_import'
+           ELSE 'article_already_exists'
+           END AS reason
+FROM articles_import i
+         LEFT OUTER JOIN users u ON
+    u.username = i.author_username
+         LEFT OUTER JOIN candidates c ON
+    c.slug = i.slug
+         LEFT OUTER JOIN inserted ins ON
+            ins.slug = i.slug
+        AND c.line_number = i.line_number
+WHERE ins.id IS NULL
+ORDER BY i.line_number;
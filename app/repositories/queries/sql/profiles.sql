@@ -13,3 +13,17 @@ FROM users u
         WHERE username = :following_username)
 WHERE u.username = :follower_username
 LIMIT 1;
+
+
+-- name: get-profiles-by-usernames
+SELECT u.username,
+       u.bio,
+       u.image,
+       EXISTS(
+           SELECT 1
+           FROM followers_to_followings f
+           WHERE f.following_id = u.id
+             AND f.follower_id = (SELECT id FROM users WHERE username = :follower_username)
+       ) AS following
+FROM users u
+WHERE u.username = ANY (:usernames);
@@ -1,5 +1,20 @@
--- name: create-new-role<!
-INSERT INTO roles (name) VALUES (:name) ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name RETURNING id;
+-- name: get-roles
+SELECT id,
+       name
+FROM roles;
 
--- name: create-new-user-to-role!
-INSERT INTO users_to_roles (user_id, role_id) VALUES (:user_id, :role_id)
+-- name: create-new-role<!
+-- only reached for names missing from the roles cache, known roles are never written
+WITH inserted_role AS (
+    INSERT INTO roles (name)
+        VALUES (:name)
+        ON CONFLICT (name) DO NOTHING
+        RETURNING id
+)
+SELECT id
+FROM inserted_role
+UNION ALL
+SELECT id
+FROM roles
+WHERE name = :name
+LIMIT 1;
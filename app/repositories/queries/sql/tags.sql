@@ -0,0 +1,16 @@
+-- name: create-tags-and-link-to-article!
+WITH article_tags AS (
+    SELECT DISTINCT tag
+    FROM unnest(CAST(:tags AS TEXT[])) AS tag
+),
+     created_tags AS (
+         INSERT INTO tags (tag)
+             SELECT tag
+             FROM article_tags
+             ON CONFLICT DO NOTHING
+     )
+INSERT
+INTO articles_to_tags (article_id, tag)
+SELECT :article_id, tag
+FROM article_tags
+ON CONFLICT DO NOTHING;
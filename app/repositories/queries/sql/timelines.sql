@@ -0,0 +1,227 @@
+-- name: fan-out-article-to-timelines!
+WITH author AS (
+    SELECT u.id
+    FROM users u
+             INNER JOIN articles a ON
+        a.author_id = u.id
+    WHERE a.id = :article_id
+      AND u.followers_count <= :fanout_max_followers
+),
+     followers AS (
+         SELECT f.follower_id AS id
+         FROM followers_to_followings f
+         WHERE f.following_id = (SELECT id FROM author)
+     ),
+     trimmed AS (
+         -- keep room for the new entry so every timeline stays within :max_length
+         DELETE
+             FROM timelines t
+                 USING followers fl,
+                     LATERAL (
+                         SELECT created_at, article_id
+                         FROM timelines
+                         WHERE user_id = fl.id
+                         ORDER BY created_at DESC, article_id DESC
+                         OFFSET :max_length - 1
+                         LIMIT 1
+                         ) boundary
+             WHERE t.user_id = fl.id
+                 AND (t.created_at, t.article_id) <= (boundary.created_at, boundary.article_id)
+     )
+INSERT
+INTO timelines (user_id, article_id, created_at)
+SELECT fl.id, :article_id, :created_at
+FROM followers fl
+ON CONFLICT DO NOTHING;
+
+
+-- name: fan-out-imported-articles-to-timelines!
+-- set-based fan-out-article-to-timelines for the rows of articles_imported
+INSERT
+INTO timelines (user_id, article_id, created_at)
+SELECT f.follower_id, imp.id, imp.created_at
+FROM articles_imported imp
+         INNER JOIN users u ON
+        u.id = imp.author_id
+        AND u.followers_count <= :fanout_max_followers
+         INNER JOIN followers_to_followings f ON
+    f.following_id = u.id
+ON CONFLICT DO NOTHING;
+
+
+-- name: trim-timelines-after-import!
+-- imported articles may be older than what a timeline holds, so trimming runs after
+-- the insert and keeps the newest :max_length entries whatever their origin
+WITH followers AS (
+    SELECT DISTINCT f.follower_id AS id
+    FROM articles_imported imp
+             INNER JOIN followers_to_followings f ON
+        f.following_id = imp.author_id
+)
+DELETE
+FROM timelines t
+    USING followers fl,
+        LATERAL (
+            SELECT created_at, article_id
+            FROM timelines
+            WHERE user_id = fl.id
+            ORDER BY created_at DESC, article_id DESC
+            OFFSET :max_length
+            LIMIT 1
+            ) boundary
+WHERE t.user_id = fl.id
+  AND (t.created_at, t.article_id) <= (boundary.created_at, boundary.article_id);
+
+
+-- name: get-articles-for-timeline
+WITH follower AS (
+    SELECT id
+    FROM users
+    WHERE username = :requested_username
+),
+     timeline AS (
+         (
+             SELECT t.article_id AS id,
+                    t.created_at
+             FROM timelines t
+             WHERE t.user_id = (SELECT id FROM follower)
+             ORDER BY t.created_at DESC, t.article_id DESC
+             LIMIT CAST(:limit AS INTEGER) + CAST(:offset AS INTEGER)
+         )
+         UNION
+         (
+             -- authors above the fan-out threshold are merged in at read time
+             SELECT a.id,
+                    a.created_at
+             FROM followers_to_followings ff
+                      INNER JOIN users u ON
+                     u.id = ff.following_id
+                     AND u.followers_count > :fanout_max_followers
+                      INNER JOIN articles a ON
+                 a.author_id = u.id
+             WHERE ff.follower_id = (SELECT id FROM follower)
+             ORDER BY a.created_at DESC, a.id DESC
+             LIMIT CAST(:limit AS INTEGER) + CAST(:offset AS INTEGER)
+         )
+     )
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       a.created_at,
+       a.updated_at,
+       (
+           SELECT username
+           FROM users
+           WHERE id = a.author_id
+       ) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM follower)
+       ) AS favorited,
+       (
+           -- authors who crossed the fan-out threshold still have older timeline rows,
+           -- counted once like the page deduplicates them
+           SELECT count(*)
+           FROM (
+                    SELECT t.article_id
+                    FROM timelines t
+                    WHERE t.user_id = (SELECT id FROM follower)
+                    UNION
+                    SELECT a.id
+                    FROM followers_to_followings ff
+                             INNER JOIN users u ON
+                            u.id = ff.following_id
+                            AND u.followers_count > :fanout_max_followers
+                             INNER JOIN articles a ON
+                        a.author_id = u.id
+                    WHERE ff.follower_id = (SELECT id FROM follower)
+                ) timeline_articles
+       ) AS articles_count
+FROM timeline tl
+         INNER JOIN articles a ON
+    a.id = tl.id
+ORDER BY tl.created_at DESC, tl.id DESC
+LIMIT :limit
+OFFSET
+:offset;
+
+
+-- name: get-articles-for-timeline-after
+WITH follower AS (
+    SELECT id
+    FROM users
+    WHERE username = :requested_username
+),
+     timeline AS (
+         (
+             SELECT t.article_id AS id,
+                    t.created_at
+             FROM timelines t
+             WHERE t.user_id = (SELECT id FROM follower)
+               AND (t.created_at, t.article_id) < (:after_created_at, :after_id)
+             ORDER BY t.created_at DESC, t.article_id DESC
+             LIMIT :limit
+         )
+         UNION
+         (
+             -- authors above the fan-out threshold are merged in at read time
+             SELECT a.id,
+                    a.created_at
+             FROM followers_to_followings ff
+                      INNER JOIN users u ON
+                     u.id = ff.following_id
+                     AND u.followers_count > :fanout_max_followers
+                      INNER JOIN articles a ON
+                 a.author_id = u.id
+             WHERE ff.follower_id = (SELECT id FROM follower)
+               AND (a.created_at, a.id) < (:after_created_at, :after_id)
+             ORDER BY a.created_at DESC, a.id DESC
+             LIMIT :limit
+         )
+     )
+SELECT a.id,
+       a.slug,
+       a.title,
+       a.description,
+       a.body,
+       a.image,
+       a.created_at,
+       a.updated_at,
+       (
+           SELECT username
+           FROM users
+           WHERE id = a.author_id
+       ) AS author_username,
+       ARRAY(
+           SELECT att.tag
+           FROM articles_to_tags att
+           WHERE att.article_id = a.id
+           ORDER BY att.tag
+       ) AS tags,
+       a.favorites_count,
+       a.reviews_count,
+       EXISTS(
+           SELECT 1
+           FROM favorites f
+           WHERE f.article_id = a.id
+             AND f.user_id = (SELECT id FROM follower)
+       ) AS favorited
+-- keyset pages carry no total, the first page reported it
+FROM timeline tl
+         INNER JOIN articles a ON
+    a.id = tl.id
+ORDER BY tl.created_at DESC, tl.id DESC
+LIMIT :limit;
@@ -26,11 +26,29 @@ FROM users
 WHERE username = :username
 LIMIT 1;
 
--- name: create-new-user<!
-INSERT INTO users (username, email, salt, hashed_password)
-VALUES (:username, :email, :salt, :hashed_password)
-RETURNING
-    id, created_at, updated_at;
+-- name: get-principal-by-username^
+SELECT id,
+       username
+FROM users
+WHERE username = :username
+LIMIT 1;
+
+-- name: create-new-user-with-role<!
+-- unique violations on ix_users_username and ix_users_email abort the whole statement
+WITH new_user AS (
+    INSERT INTO users (username, email, salt, hashed_password)
+        VALUES (:username, :email, :salt, :hashed_password)
+        RETURNING id, created_at, updated_at
+),
+     user_role AS (
+         INSERT INTO users_to_roles (user_id, role_id)
+             SELECT id, :role_id
+             FROM new_user
+     )
+SELECT id,
+       created_at,
+       updated_at
+FROM new_user;
 
 -- name: update-user-by-username<!
 UPDATE
@@ -44,3 +62,9 @@ SET username        = :new_username,
 WHERE username = :username
 RETURNING
     updated_at;
+
+-- name: update-user-hashed-password!
+UPDATE
+    users
+SET hashed_password = :hashed_password
+WHERE id = :id;
@@ -1,12 +1,41 @@
 from datetime import datetime
-from typing import Optional
+from itertools import chain
+from typing import Any, Dict, Optional
 
 from pypika import Parameter as CommonParameter, Query, Table
+from pypika.terms import Function, Term
+from pypika.utils import format_alias_sql
 
 class Parameter(CommonParameter):
     def __init__(self, count: int) -> None:
         super().__init__("${0}".format(count))
 
+class Array(Function):
+    def __init__(self, subquery: Query, alias: Optional[str] = None) -> None:
+        super().__init__("ARRAY", subquery, alias=alias)
+
+class Exists(Function):
+    def __init__(self, subquery: Query, alias: Optional[str] = None) -> None:
+        super().__init__("EXISTS", subquery, alias=alias)
+
+class JSONBuildObject(Function):
+    def __init__(self, fields: Dict[str, Any], alias: Optional[str] = None) -> None:
+        # keys keep their order, the same order the response schemas render them in
+        super().__init__("JSON_BUILD_OBJECT", *chain.from_iterable(fields.items()), alias=alias)
+
+class JSONTimestamp(Function):
+    def __init__(self, field: Term, alias: Optional[str] = None) -> None:
+        super().__init__("JSON_TIMESTAMP", field, alias=alias)
+
+class ArticlesCountEstimate(Term):
+    def __init__(self, alias: Optional[str] = None) -> None:
+        super().__init__(alias=alias)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        # planner statistics, cheap but only as fresh as the last ANALYZE
+        sql = "(SELECT GREATEST(reltuples, 0)::BIGINT FROM pg_class WHERE oid = 'articles'::REGCLASS)"
+        return format_alias_sql(sql, self.alias, **kwargs)
+
 class TypedTable(Table):
     __table__ = ""
 
@@ -30,6 +59,8 @@ class Users(TypedTable):
 
     id: int
     username: str
+    bio: str
+    image: Optional[str]
 
 class Articles(TypedTable):
     __table__ = "articles"
@@ -41,6 +72,8 @@ class Articles(TypedTable):
     image:str
     body: str
     author_id: int
+    favorites_count: int
+    reviews_count: int
     created_at: datetime
     updated_at: datetime
 
@@ -62,8 +95,15 @@ class Favorites(TypedTable):
     article_id: int
     user_id: int
 
+class FollowersToFollowings(TypedTable):
+    __table__ = "followers_to_followings"
+
+    follower_id: int
+    following_id: int
+
 users = Users()
 articles = Articles()
 tags = Tags()
 articles_to_tags = ArticlesToTags()
 favorites = Favorites()
+followers_to_followings = FollowersToFollowings()
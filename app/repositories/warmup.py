@@ -0,0 +1,52 @@
+from functools import lru_cache
+from itertools import product
+from typing import Tuple
+
+import asyncpg
+from aiosql.types import SQLOperationType
+from loguru import logger
+
+from app.repositories.data.articles import compile_filter_articles_query
+from app.repositories.queries.queries import queries
+
+FILTER_ARTICLES_FLAGS = ("tag", "author", "favorited", "after", "exact_count")
+
+@lru_cache(maxsize=None)
+def get_statements_to_prepare(*, articles_json_from_db: bool = False) -> Tuple[str, ...]:
+    # cursor variants share the text of their query, scripts are not prepared by asyncpg
+    aiosql_statements = [
+        query_fn.sql
+        for query_fn in (getattr(queries, query_name) for query_name in queries.available_queries)
+        if query_fn.operation != SQLOperationType.SCRIPT
+    ]
+    filter_articles_statements = [
+        compile_filter_articles_query(**dict(zip(FILTER_ARTICLES_FLAGS, flags)), as_json=articles_json_from_db)
+        for flags in product((False, True), repeat=len(FILTER_ARTICLES_FLAGS))
+    ]
+
+    return tuple(dict.fromkeys(aiosql_statements + filter_articles_statements))
+
+async def prepare_statements(connection: asyncpg.Connection, *, articles_json_from_db: bool = False) -> int:
+    # prepare() leaves asyncpg's statement cache alone, what it warms up is the backend's
+    # catalog caches and the type codecs asyncpg introspects for every statement, which
+    # is most of what the first run of a statement costs on a fresh connection
+    prepared_count = 0
+    for statement in get_statements_to_prepare(articles_json_from_db=articles_json_from_db):
+        try:
+            await connection.prepare(statement)
+        except asyncpg.PostgresError as prepare_error:
+            # e.g. statements on the temporary import tables, prepared on first use
+            logger.debug("Skipped preparing a statement: {0}", prepare_error)
+        else:
+            prepared_count += 1
+
+    return prepared_count
+
+class StatementsWarmup:
+    # pool init hook, runs for every connection the pool opens: the ones at startup and
+    # the ones replacing connections closed for idling, age or max_queries
+    def __init__(self, *, articles_json_from_db: bool = False) -> None:
+        self.articles_json_from_db = articles_json_from_db
+
+    async def __call__(self, connection: asyncpg.Connection) -> None:
+        await prepare_statements(connection, articles_json_from_db=self.articles_json_from_db)
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+# bounded LRU whose entries also expire ttl seconds after being stored
+class TTLCache(Generic[KT, VT]):
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.enabled = True
+        # bumped on every invalidation, so values read before one are not stored
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[KT, Tuple[float, VT]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: KT) -> Optional[VT]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: KT,
+        value: VT,
+        *,
+        version: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if not self.enabled or self.max_size <= 0:
+            return
+
+        if version is not None and version != self.version:
+            return
+
+        # a per entry ttl can only shorten the cache wide one
+        expires_in = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._entries[key] = (time.monotonic() + expires_in, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def pop(self, key: KT) -> None:
+        self.version += 1
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+    def _remove(self, key: KT) -> None:
+        del self._entries[key]
@@ -0,0 +1,65 @@
+import hashlib
+from typing import Any, Dict
+
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+def public_cache_control(max_age: int) -> str:
+    return "public, max-age={0}, must-revalidate".format(max_age)
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return '"{0}"'.format(digest)
+
+def make_body_etag(body: bytes) -> str:
+    return '"{0}"'.format(hashlib.sha1(body).hexdigest())
+
+def _matches_etag(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    return etag in {
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    }
+
+def is_not_modified(request: Request, *, etag: str) -> bool:
+    # no Last-Modified is sent, updated_at misses favorites, reviews, the caller's own
+    # favorited and following, and articles joining or leaving a list, so only the
+    # ETag validates and If-Modified-Since is ignored
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _matches_etag(if_none_match, etag)
+
+    return False
+
+def get_validator_headers(*, etag: str, cache_control: str) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Authorization",
+    }
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    *,
+    cache_control: str,
+) -> Response:
+    # the body is already rendered here, a match still saves sending it
+    headers = get_validator_headers(
+        etag=make_body_etag(response.body),
+        cache_control=cache_control,
+    )
+    if is_not_modified(request, etag=headers["ETag"]):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
+
+    return response
@@ -1,6 +1,8 @@
 USER_DOES_NOT_EXIST_ERROR = "user does not exist"
 ARTICLE_DOES_NOT_EXIST_ERROR = "article does not exist"
 ARTICLE_ALREADY_EXISTS = "article already exists"
+ARTICLE_DUPLICATED_IN_IMPORT = "article slug appears more than once in this import"
+MALFORMED_IMPORT_LINE = "malformed article line"
 USER_IS_NOT_AUTHOR_OF_ARTICLE = "you are not an author of this article"
 
 INCORRECT_LOGIN_INPUT = "incorrect email or password"
@@ -23,3 +25,9 @@ COMMENT_DOES_NOT_EXIST = "comment does not exist"
 AUTHENTICATION_REQUIRED = "authentication required"
 
 INVALID_FILE_TYPE = "invalid file type"
+
+MALFORMED_CURSOR = "malformed pagination cursor"
+
+DATABASE_IS_BUSY = "database is busy, try again later"
+
+METRICS_ARE_DISABLED = "metrics are disabled"
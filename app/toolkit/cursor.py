@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+Keyset = Tuple[datetime, int]
+
+def encode_cursor(created_at: datetime, id_: int) -> str:
+    raw_cursor = json.dumps([created_at.isoformat(), id_], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Keyset:
+    try:
+        raw_cursor = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id_ = json.loads(raw_cursor)
+        keyset = (datetime.fromisoformat(created_at), int(id_))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as decode_error:
+        raise ValueError("unable to decode pagination cursor") from decode_error
+
+    if keyset[0].tzinfo is None:
+        raise ValueError("pagination cursor is missing timezone")
+
+    return keyset
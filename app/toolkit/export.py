@@ -0,0 +1,47 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, List
+
+from asyncpg import Record
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return value
+
+def encode_ndjson(rows: List[Record]) -> bytes:
+    return b"".join(
+        json.dumps(
+            {key: _encode_value(value) for key, value in row.items()},
+            separators=(",", ":"),
+        ).encode() + b"\n"
+        for row in rows
+    )
+
+def encode_csv(rows: List[Record], *, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(rows[0].keys())
+
+    for row in rows:
+        # arrays are flattened the same way tag lists are sent in forms
+        writer.writerow(
+            ",".join(value) if isinstance(value, list) else _encode_value(value)
+            for value in row.values()
+        )
+
+    return buffer.getvalue().encode()
+
+async def iter_ndjson(chunks: AsyncIterator[List[Record]]) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        yield encode_ndjson(rows)
+
+async def iter_csv(chunks: AsyncIterator[List[Record]]) -> AsyncIterator[bytes]:
+    header = True
+    async for rows in chunks:
+        yield encode_csv(rows, header=header)
+        header = False
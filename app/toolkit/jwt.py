@@ -1,11 +1,14 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Any, Dict, Optional, Union
 
 import jwt
 from pydantic import BaseModel, ValidationError
 
 from app.models.domain.users import User
 from app.core.config import get_app_settings
+from app.toolkit.cache import TTLCache
 
 SETTINGS = get_app_settings()
 JWT_SUBJECT = "access"
@@ -18,10 +21,12 @@ class JWTMeta(BaseModel):
 
 class JWTUser(BaseModel):
     username: str
+    # older tokens only carry the username
+    id: Optional[int] = None
 
 def create_jwt_token(
     *,
-    jwt_content: Dict[str, str],
+    jwt_content: Dict[str, Any],
     secret_key: str,
     expires_delta: timedelta,
 ) -> str:
@@ -32,15 +37,70 @@ def create_jwt_token(
 
 def create_access_token_for_user(user: User, secret_key: str) -> str:
     return create_jwt_token(
-        jwt_content=JWTUser(username=user.username).dict(),
+        jwt_content=JWTUser(username=user.username, id=user.id).dict(exclude_none=True),
         secret_key=secret_key,
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     )
 
-def get_username_from_token(token: str, secret_key: str) -> str:
+class VerifiedTokensCache(TTLCache[bytes, JWTUser]):
+    # only tokens that passed verification are stored, keyed by their digest
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        super().__init__(max_size=max_size, ttl=ttl)
+        self.verifications = 0
+        self.verification_seconds = 0.0
+        self._secret_key: Optional[str] = None
+
+    def get_token_user(self, token: str, secret_key: str) -> Optional[JWTUser]:
+        # entries were verified with the old key and must not outlive a rotation
+        if secret_key != self._secret_key:
+            self.clear()
+            self._secret_key = secret_key
+
+        return self.get(self._get_key(token))
+
+    def set_token_user(self, token: str, token_user: JWTUser, expires_at: Optional[int]) -> None:
+        ttl = None if expires_at is None else expires_at - time.time()
+        self.set(self._get_key(token), token_user, ttl=ttl)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            **super().get_stats(),
+            "verifications": self.verifications,
+            "verification_avg_us": round(
+                self.verification_seconds / self.verifications * 1e6, 1,
+            ) if self.verifications else 0.0,
+        }
+
+    def _get_key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+verified_tokens_cache = VerifiedTokensCache(
+    max_size=SETTINGS.jwt_cache_max_size,
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+def _verify_token(token: str, secret_key: str) -> JWTUser:
+    started_at = time.perf_counter()
     try:
-        return JWTUser(**jwt.decode(token, secret_key, algorithms=[ALGORITHM])).username
+        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+        token_user = JWTUser(**payload)
     except jwt.PyJWTError as decode_error:
         raise ValueError("unable to decode JWT token") from decode_error
     except ValidationError as validation_error:
         raise ValueError("malformed payload in token") from validation_error
+    finally:
+        verified_tokens_cache.verifications += 1
+        verified_tokens_cache.verification_seconds += time.perf_counter() - started_at
+
+    verified_tokens_cache.set_token_user(token, token_user, payload.get("exp"))
+    return token_user
+
+def get_user_from_token(token: str, secret_key: str) -> JWTUser:
+    token_user = verified_tokens_cache.get_token_user(token, secret_key)
+    if token_user:
+        return token_user
+
+    return _verify_token(token, secret_key)
+
+def get_username_from_token(token: str, secret_key: str) -> str:
+    return get_user_from_token(token, secret_key).username
@@ -1,24 +1,70 @@
+import orjson
 from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
 from starlette.requests import Request
 from starlette.responses import JSONResponse
-from typing import Any, List, Optional, Union
-from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
+from typing import Any, Dict, List, Optional, Type, Union
+from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY, HTTP_503_SERVICE_UNAVAILABLE
 from starlette.requests import Request
 from fastapi.exceptions import RequestValidationError
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+
+from app.toolkit import constants
+
+# naive datetimes are taken as UTC and UTC is written as Z, the same output as
+# convert_datetime_to_base_model gives for the models' datetime fields
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+
+    return jsonable_encoder(value)
+
+class FastJSONResponse(JSONResponse):
+    # serializes pydantic models straight to bytes instead of copying them through jsonable_encoder
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+class RawJSON:
+    # JSON text rendered outside of Python, e.g. by Postgres, that goes into the body as it is
+    __slots__ = ("value",)
+
+    def __init__(self, value: bytes) -> None:
+        self.value = value
+
+def _render_with_raw_json(content: Any) -> bytes:
+    if isinstance(content, RawJSON):
+        return content.value
+
+    if isinstance(content, BaseModel):
+        content = {field.alias: getattr(content, name) for name, field in content.__fields__.items()}
+
+    # only mappings are walked, anything else is left to orjson in one call
+    if isinstance(content, dict):
+        return b"{%b}" % b",".join(
+            orjson.dumps(key) + b":" + _render_with_raw_json(value) for key, value in content.items()
+        )
+
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+class RawJSONResponse(FastJSONResponse):
+    # for content that holds RawJSON values, nested in dicts or models
+    def render(self, content: Any) -> bytes:
+        return _render_with_raw_json(content)
 
 async def response_success(
     data: Optional[Any] = None, 
     message: str = "Success", 
     status_code: int = 200,
+    response_class: Type[JSONResponse] = FastJSONResponse,
 ) -> JSONResponse:
-    return JSONResponse(
-        content=jsonable_encoder({
+    return response_class(
+        content={
             "code": status_code,
             "message": message,
             "data": data,
-        }),
+        },
         status_code=status_code,
     )
 
@@ -26,6 +72,7 @@ def error_response(
     status_code: int,
     message: Union[str, List[str]],
     errors: Optional[List[Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> JSONResponse:
     return JSONResponse(
         content={
@@ -34,6 +81,7 @@ def error_response(
             "errors": errors or [],
         },
         status_code=status_code,
+        headers=headers,
     )
 
 async def response_error(
@@ -44,6 +92,18 @@ async def response_error(
         status_code=e.status_code,
         message=e.detail if isinstance(e.detail, str) else "Error occurred",
         errors=[e.detail] if isinstance(e.detail, str) else e.detail,
+        headers=getattr(e, "headers", None),
+    )
+
+async def response_database_busy(
+    _: Request,
+    _exc: Exception,
+) -> JSONResponse:
+    return error_response(
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        message=constants.DATABASE_IS_BUSY,
+        errors=[constants.DATABASE_IS_BUSY],
+        headers={"Retry-After": "1"},
     )
 
 async def response_validation_error(
@@ -1,13 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import bcrypt
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import get_app_settings
+
+@lru_cache
+def get_password_context() -> CryptContext:
+    rounds = get_app_settings().bcrypt_rounds
+    # hashes made with any other cost are reported as needing an update
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+@lru_cache
+def get_password_executor() -> ThreadPoolExecutor:
+    # bcrypt releases the GIL, extra calls wait in the executor queue instead of piling onto the CPU
+    return ThreadPoolExecutor(
+        max_workers=get_app_settings().password_hashing_max_workers,
+        thread_name_prefix="password-hashing",
+    )
 
 def generate_salt() -> str:
     return bcrypt.gensalt().decode()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    # the second value is a fresh hash when the stored one was made with another cost
+    return await asyncio.get_running_loop().run_in_executor(
+        get_password_executor(),
+        get_password_context().verify_and_update,
+        plain_password,
+        hashed_password,
+    )
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        get_password_executor(),
+        get_password_context().hash,
+        password,
+    )
@@ -0,0 +1,64 @@
+"""Compare re-validating repository articles into response schemas with from_validated on a 100-article page.
+
+Run with: python -m benchmarks.article_projection
+"""
+import timeit
+from datetime import datetime, timezone
+from typing import List
+
+from app.models.domain.articles import Article
+from app.models.domain.profiles import Profile
+from app.models.schemas.articles import ArticleForResponse, ResponseListArticles
+from app.toolkit.response import FastJSONResponse
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+def build_articles() -> List[Article]:
+    created_at = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    return [
+        Article(
+            id_=index,
+            slug="article-{0}".format(index),
+            title="Article {0}".format(index),
+            description="description " * 5,
+            body="body " * 200,
+            image="https://example.com/{0}.png".format(index),
+            tags=["python", "postgres", "fastapi"],
+            author=Profile(username="author{0}".format(index % 10), bio="bio", image=None, following=bool(index % 2)),
+            favorited=bool(index % 3),
+            favorites_count=index,
+            reviews_count=index // 2,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for index in range(PAGE_SIZE)
+    ]
+
+def project_old(articles: List[Article]) -> ResponseListArticles:
+    return ResponseListArticles(
+        articles=[ArticleForResponse(**article.dict()) for article in articles],
+        articles_count=PAGE_SIZE,
+        next_cursor="cursor",
+    )
+
+def project_new(articles: List[Article]) -> ResponseListArticles:
+    return ResponseListArticles(
+        articles=[ArticleForResponse.from_validated(article) for article in articles],
+        articles_count=PAGE_SIZE,
+        next_cursor="cursor",
+    )
+
+def render(page: ResponseListArticles) -> bytes:
+    return FastJSONResponse(content={"code": 200, "message": "Success", "data": page}).body
+
+def main() -> None:
+    articles = build_articles()
+    assert render(project_old(articles)) == render(project_new(articles)), "responses differ"
+
+    for name, project in (("dict() + re-validation", project_old), ("from_validated", project_new)):
+        seconds = min(timeit.repeat(lambda: project(articles), number=ROUNDS, repeat=5)) / ROUNDS
+        print("{0:<24} {1:8.3f} ms per page".format(name, seconds * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare the old jsonable_encoder response path with FastJSONResponse on a 100-article page.
+
+Run with: python -m benchmarks.response_serialization
+"""
+import json
+import timeit
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from app.models.domain.profiles import Profile
+from app.models.schemas.articles import ArticleForResponse, ResponseListArticles
+from app.toolkit.response import FastJSONResponse
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+def build_page() -> ResponseListArticles:
+    created_at = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    articles = [
+        ArticleForResponse(
+            id=index,
+            slug="article-{0}".format(index),
+            title="Article {0}".format(index),
+            description="description " * 5,
+            body="body " * 200,
+            image="https://example.com/{0}.png".format(index),
+            tag_list=["python", "postgres", "fastapi"],
+            author=Profile(username="author{0}".format(index % 10), bio="bio", image=None, following=bool(index % 2)),
+            favorited=bool(index % 3),
+            favorites_count=index,
+            reviews_count=index // 2,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for index in range(PAGE_SIZE)
+    ]
+    return ResponseListArticles(articles=articles, articles_count=PAGE_SIZE, next_cursor="cursor")
+
+def render_old(page: ResponseListArticles) -> bytes:
+    return JSONResponse(content=jsonable_encoder({"code": 200, "message": "Success", "data": page})).body
+
+def render_new(page: ResponseListArticles) -> bytes:
+    return FastJSONResponse(content={"code": 200, "message": "Success", "data": page}).body
+
+def main() -> None:
+    page = build_page()
+    assert json.loads(render_old(page)) == json.loads(render_new(page)), "responses differ"
+
+    for name, render in (("jsonable_encoder + json", render_old), ("FastJSONResponse", render_new)):
+        seconds = min(timeit.repeat(lambda: render(page), number=ROUNDS, repeat=5)) / ROUNDS
+        print("{0:<24} {1:8.3f} ms per page".format(name, seconds * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compare the first run of each article query on a fresh connection with and without warmup.
+
+Needs a migrated database with articles in it. Run with: python -m benchmarks.statement_warmup
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+import asyncpg
+
+from app.core.config import get_app_settings
+from app.repositories.data.articles import ArticlesRepository
+from app.repositories.warmup import get_statements_to_prepare, prepare_statements
+
+ROUNDS = 5
+
+async def first_requests(connection: asyncpg.Connection) -> float:
+    articles_repo = ArticlesRepository(connection)
+    started = time.perf_counter()
+    await articles_repo.filter_articles(limit=20)
+    await articles_repo.filter_articles(tag="python", limit=20)
+    await articles_repo.get_articles_for_feed(limit=20)
+    await articles_repo.search_articles(query="python", limit=20)
+    return time.perf_counter() - started
+
+async def measure(init: Optional[Callable[[asyncpg.Connection], Awaitable[int]]]) -> float:
+    settings = get_app_settings()
+    timings = []
+    for _ in range(ROUNDS):
+        connection = await asyncpg.connect(
+            str(settings.database_url),
+            statement_cache_size=settings.database_statement_cache_size,
+        )
+        try:
+            if init is not None:
+                await init(connection)
+            timings.append(await first_requests(connection))
+        finally:
+            await connection.close()
+    return sorted(timings)[len(timings) // 2]
+
+async def main() -> None:
+    print("{0} statements to prepare".format(len(get_statements_to_prepare())))
+    for name, init in (("cold connection", None), ("prepared on connect", prepare_statements)):
+        seconds = await measure(init)
+        print("{0:<24} {1:8.3f} ms for the first list, filter, feed and search".format(name, seconds * 1000))
+
+if __name__ == "__main__":
+    asyncio.run(main())
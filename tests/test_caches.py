@@ -0,0 +1,232 @@
+from typing import Iterator, List, Optional
+
+import pytest
+
+from app.models.domain.articles import Article
+from app.models.domain.authentication import Principal
+from app.models.domain.profiles import Profile
+from app.repositories.cache import (
+    get_articles_cache,
+    get_principals_cache,
+    get_roles_cache,
+    handle_change,
+    set_caches_enabled,
+)
+from app.toolkit.cache import TTLCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("app.toolkit.cache.time.monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def caches() -> Iterator[None]:
+    set_caches_enabled(True)
+    get_roles_cache().load({1: 10})
+    yield
+    set_caches_enabled(False)
+    get_roles_cache().clear()
+
+
+def _make_article(slug: str, author: str) -> Article:
+    return Article(
+        slug=slug,
+        title=slug,
+        description="",
+        body="",
+        image="",
+        tags=[],
+        author=Profile(username=author),
+        favorited=False,
+        favorites_count=0,
+    )
+
+
+def _cache_articles(*articles: Article, readers: List[Optional[str]]) -> None:
+    articles_cache = get_articles_cache()
+    for article in articles:
+        for reader in readers:
+            articles_cache.set_article(
+                article=article,
+                requested_username=reader,
+                version=articles_cache.version,
+            )
+
+
+def test_get_and_set(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get_stats() == {"enabled": True, "hits": 1, "misses": 1, "size": 1, "max_size": 2}
+
+
+def test_entries_expire(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+
+    clock.now += 5
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    clock.now += 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_entry_ttl_cannot_outlive_cache_ttl(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1, ttl=60)
+
+    clock.now += 10
+
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_is_evicted(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_value_read_before_invalidation_is_not_stored(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    version = cache.version
+
+    cache.pop("a")
+    cache.set("a", 1, version=version)
+    assert cache.get("a") is None
+
+    version = cache.version
+    cache.clear()
+    cache.set("a", 1, version=version)
+    assert cache.get("a") is None
+
+    cache.set("a", 1, version=cache.version)
+    assert cache.get("a") == 1
+
+
+def test_disabled_cache_stores_nothing(clock: Clock) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.enabled = False
+    cache.set("a", 1)
+    cache.enabled = True
+
+    assert cache.get("a") is None
+
+
+def test_caches_start_disabled() -> None:
+    get_articles_cache().set_article(
+        article=_make_article("slug", "author"),
+        requested_username=None,
+        version=get_articles_cache().version,
+    )
+
+    assert get_articles_cache().get_article(slug="slug", requested_username=None) is None
+
+
+def test_slug_change_drops_every_reader(caches: None) -> None:
+    _cache_articles(
+        _make_article("first", "author"),
+        _make_article("second", "author"),
+        readers=[None, "reader"],
+    )
+
+    handle_change("slug:first")
+
+    articles_cache = get_articles_cache()
+    assert articles_cache.get_article(slug="first", requested_username=None) is None
+    assert articles_cache.get_article(slug="first", requested_username="reader") is None
+    assert articles_cache.get_article(slug="second", requested_username="reader") is not None
+
+
+def test_slug_change_with_colon_in_slug(caches: None) -> None:
+    _cache_articles(_make_article("author:slug", "author"), readers=[None])
+
+    handle_change("slug:author:slug")
+
+    assert get_articles_cache().get_article(slug="author:slug", requested_username=None) is None
+
+
+def test_author_change_drops_articles_and_principal(caches: None) -> None:
+    _cache_articles(
+        _make_article("first", "author"),
+        _make_article("second", "other"),
+        readers=[None],
+    )
+    get_principals_cache().set("author", Principal(id=1, username="author"))
+    get_principals_cache().set("other", Principal(id=2, username="other"))
+
+    handle_change("author:author")
+
+    assert get_articles_cache().get_article(slug="first", requested_username=None) is None
+    assert get_articles_cache().get_article(slug="second", requested_username=None) is not None
+    assert get_principals_cache().get("author") is None
+    assert get_principals_cache().get("other") is not None
+    assert get_roles_cache().loaded
+
+
+def test_roles_change_only_reloads_roles(caches: None) -> None:
+    _cache_articles(_make_article("first", "author"), readers=[None])
+
+    handle_change("roles")
+
+    assert not get_roles_cache().loaded
+    assert get_articles_cache().get_article(slug="first", requested_username=None) is not None
+
+
+@pytest.mark.parametrize("payload", ["", "unknown", "slug", "author"])
+def test_unknown_change_clears_everything(caches: None, payload: str) -> None:
+    _cache_articles(_make_article("first", "author"), readers=[None])
+    get_principals_cache().set("author", Principal(id=1, username="author"))
+
+    handle_change(payload)
+
+    assert get_articles_cache().get_article(slug="first", requested_username=None) is None
+    assert get_principals_cache().get("author") is None
+    assert not get_roles_cache().loaded
+
+
+def test_article_read_before_change_is_not_cached(caches: None) -> None:
+    articles_cache = get_articles_cache()
+    version = articles_cache.version
+
+    handle_change("slug:first")
+    articles_cache.set_article(
+        article=_make_article("first", "author"),
+        requested_username=None,
+        version=version,
+    )
+
+    assert articles_cache.get_article(slug="first", requested_username=None) is None
+
+
+def test_replacing_article_keeps_index(caches: None) -> None:
+    _cache_articles(_make_article("first", "author"), readers=[None])
+    _cache_articles(_make_article("first", "new-author"), readers=[None])
+
+    handle_change("author:author")
+    assert get_articles_cache().get_article(slug="first", requested_username=None) is not None
+
+    handle_change("author:new-author")
+    assert get_articles_cache().get_article(slug="first", requested_username=None) is None
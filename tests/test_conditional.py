@@ -0,0 +1,107 @@
+from typing import Dict, Optional
+
+import pytest
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.toolkit.conditional import (
+    PRIVATE_CACHE_CONTROL,
+    conditional_response,
+    is_not_modified,
+    make_body_etag,
+    make_etag,
+)
+
+ETAG = make_etag("slug", 1, "2022-01-01T00:00:00")
+
+
+def _make_request(headers: Optional[Dict[str, str]] = None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.lower().encode(), value.encode()) for name, value in (headers or {}).items()
+            ],
+        },
+    )
+
+
+def test_etag_is_quoted_and_stable() -> None:
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert make_etag("slug", 1, "2022-01-01T00:00:00") == ETAG
+    assert make_etag("slug", 2, "2022-01-01T00:00:00") != ETAG
+
+
+def test_body_etag_follows_body() -> None:
+    assert make_body_etag(b"{}") == make_body_etag(b"{}")
+    assert make_body_etag(b"{}") != make_body_etag(b"[]")
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        ETAG,
+        "W/{0}".format(ETAG),
+        '"other", {0}'.format(ETAG),
+        '"other",W/{0}'.format(ETAG),
+        "*",
+        " * ",
+    ],
+)
+def test_matching_if_none_match(if_none_match: str) -> None:
+    assert is_not_modified(_make_request({"If-None-Match": if_none_match}), etag=ETAG)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        '"other"',
+        ETAG.strip('"'),
+        "W/{0}".format(ETAG.strip('"')),
+        '"other", "another"',
+        "",
+    ],
+)
+def test_mismatching_if_none_match(if_none_match: str) -> None:
+    assert not is_not_modified(_make_request({"If-None-Match": if_none_match}), etag=ETAG)
+
+
+def test_without_validators() -> None:
+    assert not is_not_modified(_make_request(), etag=ETAG)
+
+
+def test_if_modified_since_is_ignored() -> None:
+    request = _make_request({"If-Modified-Since": "Wed, 21 Oct 2099 07:28:00 GMT"})
+
+    assert not is_not_modified(request, etag=ETAG)
+
+
+def test_conditional_response_sends_body_with_validators() -> None:
+    response = conditional_response(
+        _make_request(),
+        Response(b'{"article":{}}'),
+        cache_control=PRIVATE_CACHE_CONTROL,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.body == b'{"article":{}}'
+    assert response.headers["etag"] == make_body_etag(b'{"article":{}}')
+    assert response.headers["cache-control"] == PRIVATE_CACHE_CONTROL
+    assert response.headers["vary"] == "Authorization"
+
+
+def test_conditional_response_answers_not_modified() -> None:
+    request = _make_request({"If-None-Match": make_body_etag(b'{"article":{}}')})
+
+    response = conditional_response(
+        request,
+        Response(b'{"article":{}}'),
+        cache_control=PRIVATE_CACHE_CONTROL,
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.body == b""
+    assert response.headers["etag"] == make_body_etag(b'{"article":{}}')
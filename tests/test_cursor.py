@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.toolkit.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2022, 5, 17, 10, 30, 15, 123456, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_cursor_keeps_offset() -> None:
+    created_at = datetime(2022, 5, 17, 10, 30, tzinfo=timezone(timedelta(hours=3)))
+
+    decoded_at, _ = decode_cursor(encode_cursor(created_at, 1))
+
+    assert decoded_at.utcoffset() == timedelta(hours=3)
+
+
+def test_cursor_is_url_safe_without_padding() -> None:
+    cursor = encode_cursor(datetime(2022, 1, 1, tzinfo=timezone.utc), 7)
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        "!!!",
+        # valid base64 of plain text, not JSON
+        "aGVsbG8",
+        # ["2022-01-01T00:00:00+00:00"], one element only
+        "WyIyMDIyLTAxLTAxVDAwOjAwOjAwKzAwOjAwIl0",
+        # ["yesterday",1]
+        "WyJ5ZXN0ZXJkYXkiLDFd",
+        # ["2022-01-01T00:00:00+00:00","one"]
+        "WyIyMDIyLTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwib25lIl0",
+    ],
+)
+def test_cursor_rejects_malformed(cursor: str) -> None:
+    with pytest.raises(ValueError, match="unable to decode"):
+        decode_cursor(cursor)
+
+
+def test_cursor_rejects_naive_datetime() -> None:
+    cursor = encode_cursor(datetime(2022, 1, 1), 1)
+
+    with pytest.raises(ValueError, match="timezone"):
+        decode_cursor(cursor)
@@ -0,0 +1,92 @@
+import itertools
+import re
+from typing import List, Optional
+
+import pytest
+
+from app.repositories.data.articles import ARTICLES_COUNT_ALIAS, compile_filter_articles_query
+
+FLAGS = list(itertools.product([False, True], repeat=4))
+
+
+def _get_parameter(query: str, pattern: str) -> Optional[int]:
+    match = re.search(pattern, query)
+    return int(match.group(1)) if match else None
+
+
+def _get_expected_order(*, tag: bool, author: bool, favorited: bool, after: bool) -> List[str]:
+    # the order ArticlesRepository.filter_articles passes its values in
+    order = ["requested_user"]
+    order += ["tag"] if tag else []
+    order += ["author"] if author else []
+    order += ["favorited"] if favorited else []
+    order += ["after_created_at", "after_id"] if after else []
+    order += ["limit"]
+    order += [] if after else ["offset"]
+    return order
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+@pytest.mark.parametrize("tag, author, favorited, after", FLAGS)
+def test_parameters_are_numbered_in_order(
+    tag: bool,
+    author: bool,
+    favorited: bool,
+    after: bool,
+    as_json: bool,
+) -> None:
+    query = compile_filter_articles_query(
+        tag=tag,
+        author=author,
+        favorited=favorited,
+        after=after,
+        as_json=as_json,
+    )
+
+    after_match = re.search(r'\((?:"articles"\.)?"created_at",(?:"articles"\.)?"id"\)>\(\$(\d+),\$(\d+)\)', query)
+    parameters = {
+        "requested_user": _get_parameter(query, r'"f"\."user_id"=\(SELECT "id" FROM "users" WHERE "username"=\$(\d+)\)'),
+        "tag": _get_parameter(query, r'FROM "tags" WHERE "tag"=\$(\d+)'),
+        "author": _get_parameter(query, r'"users"\."id"=\(SELECT "id" FROM "users" WHERE "username"=\$(\d+)\)'),
+        "favorited": _get_parameter(query, r'"favorites"\."user_id"=\(SELECT "id" FROM "users" WHERE "username"=\$(\d+)\)'),
+        "after_created_at": int(after_match.group(1)) if after_match else None,
+        "after_id": int(after_match.group(2)) if after_match else None,
+        "limit": _get_parameter(query, r"LIMIT \$(\d+)"),
+        "offset": _get_parameter(query, r"OFFSET \$(\d+)"),
+    }
+    expected_order = _get_expected_order(tag=tag, author=author, favorited=favorited, after=after)
+
+    assert {name: number for name, number in parameters.items() if number is not None} == {
+        name: number for number, name in enumerate(expected_order, start=1)
+    }
+    assert sorted({int(number) for number in re.findall(r"\$(\d+)", query)}) == list(
+        range(1, len(expected_order) + 1),
+    )
+
+
+@pytest.mark.parametrize("tag, author, favorited", list(itertools.product([False, True], repeat=3)))
+def test_keyset_pages_are_not_counted(tag: bool, author: bool, favorited: bool) -> None:
+    query = compile_filter_articles_query(tag=tag, author=author, favorited=favorited, after=True)
+
+    assert ARTICLES_COUNT_ALIAS not in query
+
+
+def test_first_page_counts_exactly_by_default() -> None:
+    query = compile_filter_articles_query(tag=True, author=False, favorited=False, after=False)
+
+    assert "COUNT(*)" in query
+    assert '"{0}"'.format(ARTICLES_COUNT_ALIAS) in query
+
+
+def test_unfiltered_page_can_estimate_count() -> None:
+    query = compile_filter_articles_query(
+        tag=False,
+        author=False,
+        favorited=False,
+        after=False,
+        exact_count=False,
+    )
+
+    assert "COUNT(*)" not in query
+    assert '"{0}"'.format(ARTICLES_COUNT_ALIAS) in query
+    assert "JOIN (" not in query
@@ -0,0 +1,130 @@
+import time
+from datetime import timedelta
+from typing import Iterator
+
+import pytest
+
+from app.models.domain.users import User
+from app.toolkit.jwt import (
+    JWTUser,
+    VerifiedTokensCache,
+    create_access_token_for_user,
+    create_jwt_token,
+    get_user_from_token,
+    verified_tokens_cache,
+)
+
+SECRET_KEY = "a-secret-key-long-enough-for-hs256"
+ROTATED_SECRET_KEY = "a-rotated-key-long-enough-for-hs256"
+
+
+@pytest.fixture(autouse=True)
+def tokens_cache() -> Iterator[VerifiedTokensCache]:
+    verified_tokens_cache.clear()
+    verified_tokens_cache.verifications = 0
+    yield verified_tokens_cache
+    verified_tokens_cache.clear()
+
+
+@pytest.fixture
+def token() -> str:
+    return create_access_token_for_user(User(id=1, username="username"), SECRET_KEY)
+
+
+def test_token_is_verified_once(tokens_cache: VerifiedTokensCache, token: str) -> None:
+    assert get_user_from_token(token, SECRET_KEY) == JWTUser(username="username", id=1)
+    assert get_user_from_token(token, SECRET_KEY) == JWTUser(username="username", id=1)
+
+    assert tokens_cache.verifications == 1
+    assert tokens_cache.get_stats()["hits"] == 1
+
+
+def test_token_is_kept_by_digest(tokens_cache: VerifiedTokensCache, token: str) -> None:
+    get_user_from_token(token, SECRET_KEY)
+
+    assert token.encode() not in tokens_cache._entries  # noqa: WPS437
+    assert len(tokens_cache) == 1
+
+
+def test_rotated_secret_drops_verified_tokens(tokens_cache: VerifiedTokensCache, token: str) -> None:
+    get_user_from_token(token, SECRET_KEY)
+
+    with pytest.raises(ValueError, match="unable to decode"):
+        get_user_from_token(token, ROTATED_SECRET_KEY)
+
+    assert len(tokens_cache) == 0
+    assert tokens_cache.verifications == 2
+
+
+def test_rotating_back_verifies_again(tokens_cache: VerifiedTokensCache, token: str) -> None:
+    get_user_from_token(token, SECRET_KEY)
+    with pytest.raises(ValueError):
+        get_user_from_token(token, ROTATED_SECRET_KEY)
+
+    get_user_from_token(token, SECRET_KEY)
+
+    assert tokens_cache.verifications == 3
+
+
+def test_failed_verification_is_not_cached(tokens_cache: VerifiedTokensCache) -> None:
+    expired_token = create_jwt_token(
+        jwt_content={"username": "username"},
+        secret_key=SECRET_KEY,
+        expires_delta=timedelta(minutes=-1),
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="unable to decode"):
+            get_user_from_token(expired_token, SECRET_KEY)
+
+    assert len(tokens_cache) == 0
+    assert tokens_cache.verifications == 2
+
+
+def test_malformed_payload_is_rejected(tokens_cache: VerifiedTokensCache) -> None:
+    token = create_jwt_token(
+        jwt_content={"user": "username"},
+        secret_key=SECRET_KEY,
+        expires_delta=timedelta(minutes=1),
+    )
+
+    with pytest.raises(ValueError, match="malformed payload"):
+        get_user_from_token(token, SECRET_KEY)
+
+    assert len(tokens_cache) == 0
+
+
+def test_entry_expires_with_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr("app.toolkit.cache.time.monotonic", lambda: now)
+    tokens_cache = VerifiedTokensCache(max_size=10, ttl=3600)
+    tokens_cache.get_token_user("token", SECRET_KEY)
+
+    tokens_cache.set_token_user("token", JWTUser(username="username"), int(time.time()) + 60)
+    assert tokens_cache.get_token_user("token", SECRET_KEY) == JWTUser(username="username")
+
+    now += 61
+    assert tokens_cache.get_token_user("token", SECRET_KEY) is None
+
+
+def test_token_without_expiry_uses_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr("app.toolkit.cache.time.monotonic", lambda: now)
+    tokens_cache = VerifiedTokensCache(max_size=10, ttl=60)
+    tokens_cache.get_token_user("token", SECRET_KEY)
+
+    tokens_cache.set_token_user("token", JWTUser(username="username"), None)
+
+    now += 59
+    assert tokens_cache.get_token_user("token", SECRET_KEY) is not None
+    now += 1
+    assert tokens_cache.get_token_user("token", SECRET_KEY) is None
+
+
+def test_stats_report_verification_time(tokens_cache: VerifiedTokensCache, token: str) -> None:
+    assert tokens_cache.get_stats()["verification_avg_us"] == 0.0
+
+    get_user_from_token(token, SECRET_KEY)
+
+    assert tokens_cache.get_stats()["verifications"] == 1
+    assert tokens_cache.get_stats()["verification_avg_us"] > 0
@@ -0,0 +1,338 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from app.repositories.errors import ConnectionAcquireTimeout
+from app.repositories.pool import REPLICA_LAG_QUERY, InstrumentedPool, LazyConnection, Replica
+
+
+class FakeConnection:
+    def __init__(self, name: str, *, connected_at: Optional[float] = None) -> None:
+        self.name = name
+        self.connected_at = time.monotonic() if connected_at is None else connected_at
+        self.statements: List[str] = []
+        self.transactions: List[Dict[str, Any]] = []
+        self.closed = False
+        self.lag: Any = 0.0
+
+    async def fetch(self, query: str, *args: Any) -> List[str]:
+        self.statements.append(query)
+        return [self.name]
+
+    async def fetchrow(self, query: str, *args: Any) -> str:
+        self.statements.append(query)
+        return self.name
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        self.statements.append(query)
+        if isinstance(self.lag, Exception):
+            raise self.lag
+
+        return self.name if query != REPLICA_LAG_QUERY else self.lag
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.statements.append(query)
+        return self.name
+
+    async def copy_records_to_table(self, table_name: str, **kwargs: Any) -> str:
+        self.statements.append("COPY {0}".format(table_name))
+        return self.name
+
+    @asynccontextmanager
+    async def transaction(self, **kwargs: Any) -> AsyncIterator[None]:
+        self.transactions.append(kwargs)
+        yield
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakePool:
+    # the part of asyncpg.Pool InstrumentedPool uses
+    def __init__(self, name: str, *, size: int = 2) -> None:
+        self.failure: Optional[Exception] = None
+        self._idle = [FakeConnection("{0}-{1}".format(name, index)) for index in range(size)]
+        self.size = size
+        self.released: List[FakeConnection] = []
+
+    async def acquire(self, *, timeout: float) -> FakeConnection:
+        if self.failure is not None:
+            raise self.failure
+
+        if not self._idle:
+            raise asyncio.TimeoutError
+
+        return self._idle.pop(0)
+
+    async def release(self, connection: FakeConnection) -> None:
+        self.released.append(connection)
+        self._idle.append(connection)
+
+    def get_size(self) -> int:
+        return self.size
+
+    def get_min_size(self) -> int:
+        return 0
+
+    def get_max_size(self) -> int:
+        return self.size
+
+    def get_idle_size(self) -> int:
+        return len(self._idle)
+
+    def set_lag(self, lag: Any) -> None:
+        for connection in self._idle:
+            connection.lag = lag
+
+
+def make_pool(name: str = "primary", *, size: int = 2, max_connection_age: float = 60) -> InstrumentedPool:
+    return InstrumentedPool(
+        FakePool(name, size=size),  # type: ignore[arg-type]
+        acquire_timeout=1,
+        max_connection_age=max_connection_age,
+    )
+
+
+async def test_every_statement_checks_out_its_own_connection() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    assert await connection.fetch("SELECT 1") == ["primary-0"]
+    assert await connection.fetchrow("SELECT 2") == "primary-1"
+    assert await connection.fetchval("SELECT 3") == "primary-0"
+    assert await connection.execute("SELECT 4") == "primary-1"
+    assert await connection.copy_records_to_table("articles", records=[]) == "primary-0"
+
+    assert pool.acquired == 5
+    assert pool.in_use == 0
+
+
+async def test_nothing_is_checked_out_without_statements() -> None:
+    pool = make_pool()
+
+    LazyConnection(pool)
+
+    assert pool.acquired == 0
+
+
+async def test_unit_of_work_holds_one_connection() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    async with connection.unit_of_work() as held:
+        await connection.fetch("SELECT 1")
+        async with connection.unit_of_work() as nested:
+            await connection.execute("SELECT 2")
+
+        assert nested is held
+        assert pool.in_use == 1
+
+    assert held.statements == ["SELECT 1", "SELECT 2"]
+    assert pool.acquired == 1
+    assert pool.in_use == 0
+
+
+async def test_unit_of_work_returns_connection_on_error() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    with pytest.raises(RuntimeError):
+        async with connection.unit_of_work():
+            raise RuntimeError
+
+    assert pool.in_use == 0
+    assert await connection.fetchval("SELECT 1") == "primary-1"
+
+
+async def test_transaction_runs_on_held_connection() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    async with connection.transaction(isolation="repeatable_read") as held:
+        await connection.execute("UPDATE articles")
+
+    assert held.transactions == [{"isolation": "repeatable_read"}]
+    assert held.statements == ["UPDATE articles"]
+    assert pool.acquired == 1
+
+
+async def test_pool_protocol_reuses_held_connection() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    checked_out = await connection.acquire()
+    await connection.release(checked_out)
+    assert pool.in_use == 0
+
+    async with connection.unit_of_work() as held:
+        assert await connection.acquire() is held
+        await connection.release(held)
+        assert pool.in_use == 1
+
+
+async def test_checkout_timeout() -> None:
+    pool = make_pool(size=1)
+    connection = LazyConnection(pool)
+
+    async with connection.unit_of_work():
+        with pytest.raises(ConnectionAcquireTimeout):
+            await LazyConnection(pool).fetch("SELECT 1")
+
+    assert pool.acquire_timeouts == 1
+    assert pool.waiting == 0
+    assert pool.get_stats()["acquire_latency"]["count"] == 1
+
+
+async def test_old_connections_are_recycled() -> None:
+    pool = make_pool(max_connection_age=0)
+
+    async with pool.acquire() as connection:
+        pass
+
+    assert connection.closed
+    assert pool.recycled == 1
+    assert pool.in_use == 0
+
+
+async def test_pool_stats() -> None:
+    pool = make_pool()
+
+    await LazyConnection(pool).fetch("SELECT 1")
+
+    stats = pool.get_stats()
+    assert stats["size"] == 2
+    assert stats["idle"] == 2
+    assert stats["in_use"] == 0
+    assert stats["acquired"] == 1
+
+
+def make_replica(*, lag: Any = 0.0, max_lag: float = 5) -> Replica:
+    replica = Replica(make_pool("replica"), max_lag=max_lag)
+    replica.pool._pool.set_lag(lag)  # noqa: WPS437
+    return replica
+
+
+async def test_read_only_without_replica_uses_primary() -> None:
+    pool = make_pool()
+    connection = LazyConnection(pool)
+
+    async with connection.read_only() as held:
+        assert await connection.fetch("SELECT 1") == [held.name]
+
+    assert held.name.startswith("primary")
+    assert not connection.last_read_from_replica
+    assert pool.acquired == 1
+
+
+async def test_read_only_uses_healthy_replica() -> None:
+    pool = make_pool()
+    replica = make_replica()
+    await replica.check()
+    connection = LazyConnection(pool, replica)
+
+    async with connection.read_only() as held:
+        assert await connection.fetch("SELECT 1") == [held.name]
+        assert await connection.fetchval("SELECT 2") == held.name
+
+    assert held.name.startswith("replica")
+    assert held.statements[-2:] == ["SELECT 1", "SELECT 2"]
+    assert connection.last_read_from_replica
+    assert pool.acquired == 0
+    assert replica.pool.in_use == 0
+
+
+async def test_statements_after_read_only_go_to_primary() -> None:
+    pool = make_pool()
+    replica = make_replica()
+    await replica.check()
+    connection = LazyConnection(pool, replica)
+
+    async with connection.read_only():
+        pass
+    assert await connection.execute("UPDATE articles") == "primary-0"
+
+
+async def test_reads_after_primary_was_used_stay_on_primary() -> None:
+    pool = make_pool()
+    replica = make_replica()
+    await replica.check()
+    connection = LazyConnection(pool, replica)
+
+    await connection.execute("UPDATE articles")
+    async with connection.read_only() as held:
+        pass
+
+    assert held.name.startswith("primary")
+    assert not connection.last_read_from_replica
+
+
+async def test_read_only_inside_unit_of_work_stays_on_held_connection() -> None:
+    replica = make_replica()
+    await replica.check()
+    connection = LazyConnection(make_pool(), replica)
+
+    async with connection.unit_of_work() as held:
+        async with connection.read_only() as read_only_held:
+            assert read_only_held is held
+
+
+async def test_unhealthy_replica_is_skipped() -> None:
+    pool = make_pool()
+    replica = make_replica(lag=10.0)
+    await replica.check()
+    connection = LazyConnection(pool, replica)
+
+    async with connection.read_only() as held:
+        pass
+
+    assert not replica.healthy
+    assert held.name.startswith("primary")
+
+
+async def test_failed_replica_checkout_falls_back_to_primary() -> None:
+    pool = make_pool()
+    replica = make_replica()
+    await replica.check()
+    replica.pool._pool.failure = OSError("connection refused")  # noqa: WPS437
+    connection = LazyConnection(pool, replica)
+
+    async with connection.read_only() as held:
+        pass
+
+    assert held.name.startswith("primary")
+    assert not connection.last_read_from_replica
+    assert not replica.healthy
+
+
+@pytest.mark.parametrize(
+    "lag, healthy",
+    [
+        (0.0, True),
+        (5.0, True),
+        (5.1, False),
+        # not streaming from the primary
+        (None, False),
+        (OSError("connection refused"), False),
+    ],
+)
+async def test_replica_check(lag: Any, healthy: bool) -> None:
+    replica = make_replica(lag=lag)
+
+    await replica.check()
+
+    assert replica.healthy is healthy
+    assert replica.get_stats()["healthy"] is healthy
+    assert replica.lag == (lag if isinstance(lag, float) else None)
+
+
+async def test_replica_comes_back_after_check() -> None:
+    replica = make_replica(lag=10.0)
+    await replica.check()
+    replica.pool._pool.set_lag(0.0)  # noqa: WPS437
+
+    await replica.check()
+
+    assert replica.healthy
@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+from typing import Any
+
+import orjson
+import pytest
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from app.models.domain.profiles import Profile
+from app.models.schemas.articles import (
+    ArticleForResponse,
+    ArticleSearchResultForResponse,
+    ArticlesCountMode,
+    ResponseListArticles,
+    ResponseSearchArticles,
+)
+from app.toolkit.response import FastJSONResponse, RawJSON, RawJSONResponse, response_success
+
+ARTICLE = ArticleForResponse(
+    id=1,
+    slug="how-to-train-your-dragon",
+    title="How to train your dragon",
+    description="Ever wonder how?",
+    body="It takes a Jacobian — or two",
+    image="",
+    tags=["dragons", "training"],
+    author=Profile(username="jake", bio="I work at statefarm", image=None, following=True),
+    favorited=False,
+    favorites_count=3,
+    created_at=datetime(2022, 2, 18, 3, 22, 56, 637000),
+    updated_at=datetime(2022, 2, 18, 3, 48, 35, tzinfo=timezone.utc),
+)
+
+
+def _render_with_jsonable_encoder(content: Any) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        {"unicode": "Привет, 世界", "escaped": '"quoted"\n\\', "number": 1.5, "empty": []},
+        ARTICLE,
+        ResponseListArticles(
+            articles=[ARTICLE, ARTICLE],
+            articles_count=2,
+            articles_count_mode=ArticlesCountMode.exact,
+        ),
+        ResponseListArticles(
+            articles=[],
+            articles_count=None,
+            articles_count_mode=None,
+            next_cursor="cursor",
+        ),
+        ResponseSearchArticles(
+            articles=[
+                ArticleSearchResultForResponse(
+                    **dict(ARTICLE),
+                    rank=0.0759909,
+                    snippet="<b>dragon</b>",
+                ),
+            ],
+            articles_count=1,
+        ),
+    ],
+)
+def test_fast_response_matches_jsonable_encoder(content: Any) -> None:
+    envelope = {"code": 200, "message": "Success", "data": content}
+
+    assert FastJSONResponse(envelope).body == _render_with_jsonable_encoder(envelope)
+
+
+def test_datetimes_are_written_as_utc() -> None:
+    body = orjson.loads(FastJSONResponse(ARTICLE).body)
+
+    assert body["createdAt"] == "2022-02-18T03:22:56.637000Z"
+    assert body["updatedAt"] == "2022-02-18T03:48:35Z"
+
+
+def test_raw_json_goes_into_body_as_it_is() -> None:
+    raw_article = orjson.dumps(jsonable_encoder(ARTICLE))
+    content = {"code": 200, "message": "Success", "data": {"article": RawJSON(raw_article)}}
+
+    body = RawJSONResponse(content).body
+
+    assert body == _render_with_jsonable_encoder(
+        {"code": 200, "message": "Success", "data": {"article": ARTICLE}},
+    )
+
+
+def test_raw_json_inside_model() -> None:
+    content = ResponseListArticles.construct(
+        articles=RawJSON(b'[{"slug":"raw"}]'),
+        articles_count=1,
+        articles_count_mode=ArticlesCountMode.exact,
+        next_cursor=None,
+    )
+
+    assert orjson.loads(RawJSONResponse(content).body) == {
+        "articles": [{"slug": "raw"}],
+        "articlesCount": 1,
+        "articlesCountMode": "exact",
+        "nextCursor": None,
+    }
+
+
+def test_raw_json_at_top_level() -> None:
+    assert RawJSONResponse(RawJSON(b'{"a":1}')).body == b'{"a":1}'
+
+
+async def test_response_success_envelope() -> None:
+    response = await response_success(data=ARTICLE, message="Created", status_code=201)
+
+    assert response.status_code == 201
+    assert isinstance(response, FastJSONResponse)
+    assert response.body == _render_with_jsonable_encoder(
+        {"code": 201, "message": "Created", "data": ARTICLE},
+    )
+
+
+async def test_response_success_with_raw_json() -> None:
+    response = await response_success(
+        data={"article": RawJSON(b'{"slug":"raw"}')},
+        response_class=RawJSONResponse,
+    )
+
+    assert response.body == b'{"code":200,"message":"Success","data":{"article":{"slug":"raw"}}}'
@@ -0,0 +1,64 @@
+import os
+from typing import List
+
+import asyncpg
+import pytest
+
+from app.repositories.warmup import StatementsWarmup, get_statements_to_prepare, prepare_statements
+
+
+class FakeConnection:
+    def __init__(self, *, failing: str = "") -> None:
+        self.failing = failing
+        self.prepared: List[str] = []
+
+    async def prepare(self, statement: str) -> None:
+        if self.failing and self.failing in statement:
+            raise asyncpg.exceptions.UndefinedTableError('relation "{0}" does not exist'.format(self.failing))
+
+        self.prepared.append(statement)
+
+
+def test_statements_are_unique() -> None:
+    statements = get_statements_to_prepare()
+
+    assert len(statements) == len(set(statements))
+    assert get_statements_to_prepare(articles_json_from_db=True) != statements
+
+
+async def test_every_statement_is_prepared() -> None:
+    connection = FakeConnection()
+
+    prepared_count = await prepare_statements(connection)  # type: ignore[arg-type]
+
+    assert prepared_count == len(get_statements_to_prepare())
+    assert tuple(connection.prepared) == get_statements_to_prepare()
+
+
+async def test_failing_statements_are_skipped() -> None:
+    connection = FakeConnection(failing="articles_import")
+
+    prepared_count = await prepare_statements(connection)  # type: ignore[arg-type]
+
+    assert 0 < prepared_count < len(get_statements_to_prepare())
+    assert prepared_count == len(connection.prepared)
+
+
+async def test_warmup_hook_prepares_json_variant() -> None:
+    connection = FakeConnection()
+
+    await StatementsWarmup(articles_json_from_db=True)(connection)  # type: ignore[arg-type]
+
+    assert tuple(connection.prepared) == get_statements_to_prepare(articles_json_from_db=True)
+
+
+# runs against the installed asyncpg, so a release that changes prepare() fails here first
+@pytest.mark.skipif(not os.environ.get("DATABASE_URL"), reason="needs a migrated database")
+async def test_statements_prepare_on_database() -> None:
+    connection = await asyncpg.connect(os.environ["DATABASE_URL"])
+    try:
+        prepared_count = await prepare_statements(connection)
+    finally:
+        await connection.close()
+
+    assert prepared_count > len(get_statements_to_prepare()) // 2